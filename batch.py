@@ -0,0 +1,149 @@
+import argparse
+import csv
+import glob
+import inspect
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from main import ALGORITHMS, Process, average_turnaround_time, average_waiting_time, load_workload
+from process_table import ProcessTable, fits_table, parse_time
+
+
+def parse_value(text):
+    # Numbers keep their exact value (int or Fraction), anything else stays a string
+    try:
+        return parse_time(text)
+    except ValueError:
+        return text
+
+
+def parse_param_grid(specs):
+    # ["time_quantum=1,2,4"] -> {"time_quantum": [1, 2, 4]}; tuple values join their items
+    # with ':', e.g. "quanta=4:8:16,2:4" -> {"quanta": [(4, 8, 16), (2, 4)]}
+    grid = {}
+    for spec in specs:
+        name, sep, values = spec.partition('=')
+        if not sep or not values:
+            raise ValueError(f"invalid parameter grid {spec!r}, expected NAME=V1,V2,...")
+        grid[name] = [tuple(map(parse_value, value.split(':'))) if ':' in value else parse_value(value)
+                      for value in values.split(',')]
+    return grid
+
+
+def expand_configs(input_files, algorithm_names, grid):
+    # Cross product of files, algorithms and the parameters each algorithm accepts
+    configs = []
+    for file_name in input_files:
+        for name in algorithm_names:
+            function, _ = ALGORITHMS[name]
+            parameters = inspect.signature(function).parameters
+            accepted = [param for param in grid if param in parameters]
+            choices = []
+            for param in accepted:
+                if isinstance(parameters[param].default, tuple):
+                    # A tuple parameter given a single value, e.g. quanta=4: one-element tuple
+                    choices.append([value if isinstance(value, tuple) else (value,) for value in grid[param]])
+                else:
+                    tuples = [value for value in grid[param] if isinstance(value, tuple)]
+                    if tuples:
+                        raise ValueError(f"{name} takes a single value for {param}, "
+                                         f"got {':'.join(map(str, tuples[0]))}")
+                    choices.append(grid[param])
+            for values in itertools.product(*choices):
+                configs.append((file_name, name, dict(zip(accepted, values))))
+    return configs
+
+
+@lru_cache(maxsize=8)
+def _load_table(file_name):
+    processes = load_workload(file_name)
+    if isinstance(processes, ProcessTable) or not fits_table(processes):
+        return processes  # Fractional times stay a list of Process
+    return ProcessTable.from_processes(processes)
+
+
+def run_config(config):
+    file_name, name, params = config
+    function, algorithm_type = ALGORITHMS[name]
+    workload = _load_table(file_name)
+    if isinstance(workload, ProcessTable):
+        processes = workload.copy()  # Pristine copy of the cached workload
+    else:
+        processes = [Process(p.process_id, p.arrival_time, p.burst_time, p.priority) for p in workload]
+    start = time.perf_counter()
+    result = function(processes, **params)
+    elapsed = time.perf_counter() - start
+    return {
+        'input_file': file_name,
+        'algorithm': name,
+        'algorithm_type': algorithm_type,
+        'params': params,
+        'processes': len(processes),
+        'avg_waiting_time': average_waiting_time(result),
+        'avg_turnaround_time': average_turnaround_time(result),
+        'elapsed_seconds': elapsed,
+    }
+
+
+def run_batch(configs, max_workers=None):
+    # Configurations are grouped by file so each worker mostly reuses its cached workload
+    chunksize = max(1, len(configs) // (4 * (max_workers or os.cpu_count() or 1)))
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(run_config, configs, chunksize=chunksize))
+
+
+def write_results(file_path, results):
+    if file_path.endswith('.csv'):
+        with open(file_path, 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=list(results[0]) if results else [])
+            writer.writeheader()
+            for row in results:
+                writer.writerow(dict(row, params=json.dumps(row['params'], sort_keys=True, default=str)))
+    else:
+        with open(file_path, 'w') as file:
+            json.dump(results, file, indent=1, default=str)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run every combination of workload files, algorithms and parameters.")
+    parser.add_argument('--inputs', nargs='+', default=['input*.txt'], help="glob patterns of workload files")
+    parser.add_argument('--algorithms', nargs='+', choices=sorted(ALGORITHMS),
+                        help="default: every single-core algorithm, rr only with a time_quantum grid")
+    parser.add_argument('--param', action='append', default=[], metavar='NAME=V1,V2',
+                        help="parameter grid, e.g. time_quantum=1,2,4 or quanta=4:8:16,2:4 (repeatable)")
+    parser.add_argument('--output', default='batch_results.json', help="result file (.json or .csv)")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    args = parser.parse_args(argv)
+
+    input_files = sorted({name for pattern in args.inputs for name in glob.glob(pattern)},
+                         key=lambda name: (len(name), name))
+    if not input_files:
+        parser.error(f"no workload files match {' '.join(args.inputs)}")
+    try:
+        grid = parse_param_grid(args.param)
+    except ValueError as error:
+        parser.error(str(error))
+    algorithms = args.algorithms
+    if algorithms is None:
+        # multicore with its defaults is fcfs again; rr has no default quantum
+        algorithms = [name for name in sorted(ALGORITHMS)
+                      if name != 'multicore' and (name != 'rr' or 'time_quantum' in grid)]
+    elif 'rr' in algorithms and 'time_quantum' not in grid:
+        parser.error("round robin needs a time quantum grid, e.g. --param time_quantum=2,4")
+
+    try:
+        configs = expand_configs(input_files, algorithms, grid)
+    except ValueError as error:
+        parser.error(str(error))
+    start = time.perf_counter()
+    results = run_batch(configs, args.workers)
+    write_results(args.output, results)
+    print(f"Ran {len(results)} configurations in {time.perf_counter() - start:.2f}s, results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
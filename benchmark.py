@@ -0,0 +1,143 @@
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from main import (Process, cfs, fcfs, lottery_scheduling, mlfq, priority_non_preemptive, priority_preemptive,
+                  round_robin, sjf_non_preemptive, srtf_preemptive, stride_scheduling)
+
+BENCHMARKS = {
+    'fcfs': fcfs,
+    'sjf_non_preemptive': sjf_non_preemptive,
+    'round_robin': lambda processes: round_robin(processes, 4),
+    'srtf_preemptive': srtf_preemptive,
+    'priority_preemptive': priority_preemptive,
+    'priority_non_preemptive': priority_non_preemptive,
+    'mlfq': lambda processes: mlfq(processes, (4, 8, 16), 1000),
+    'cfs': cfs,
+    'stride_scheduling': stride_scheduling,
+    'lottery_scheduling': lottery_scheduling,
+}
+
+
+def generate_workload(count, seed=0, mean_gap=5, max_burst=20, priorities=10):
+    # Poisson-like arrivals with a load around 2x, so ready queues actually build up
+    rng = random.Random(seed)
+    processes = []
+    arrival_time = 0
+    for process_id in range(count):
+        arrival_time += rng.randint(0, 2 * mean_gap)
+        processes.append(Process(process_id, arrival_time, rng.randint(1, max_burst), rng.randrange(priorities)))
+    return processes
+
+
+def measure(algorithm, count, seed, with_memory):
+    processes = generate_workload(count, seed)
+    start = time.perf_counter()
+    algorithm(processes)
+    elapsed = time.perf_counter() - start
+
+    peak_memory = None
+    if with_memory:
+        # Separate run: tracemalloc slows the algorithm down, so it must not affect the timing
+        processes = generate_workload(count, seed)
+        tracemalloc.start()
+        algorithm(processes)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed, peak_memory
+
+
+def scaling_exponent(points):
+    # Least-squares slope of log(time) over log(size): 1.0 is linear, 2.0 quadratic
+    points = [(math.log(size), math.log(seconds)) for size, seconds in points if seconds > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    denominator = sum((x - mean_x) ** 2 for x, _ in points)
+    if denominator == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / denominator
+
+
+def run_benchmarks(algorithms, sizes, seed=0, time_limit=60.0, with_memory=True):
+    results = {}
+    for name in algorithms:
+        runs = []
+        for size in sizes:
+            elapsed, peak_memory = measure(BENCHMARKS[name], size, seed, with_memory)
+            runs.append({'size': size, 'seconds': elapsed, 'peak_memory_bytes': peak_memory})
+            print(f"{name:<24} n={size:<10} {elapsed:10.4f}s" +
+                  (f" {peak_memory / 2 ** 20:10.1f} MiB" if peak_memory is not None else ""))
+            if elapsed > time_limit:
+                print(f"{name:<24} stopping after {elapsed:.1f}s (time limit {time_limit}s)")
+                break
+        exponent = scaling_exponent([(run['size'], run['seconds']) for run in runs])
+        results[name] = {'runs': runs, 'scaling_exponent': exponent}
+    return results
+
+
+def find_regressions(results, baseline, time_tolerance=1.5, exponent_tolerance=0.25):
+    # A run is a regression when it is time_tolerance times slower than the baseline at the same
+    # size, or when the fitted exponent grew by more than exponent_tolerance
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        base = baseline[name]
+        base_runs = {run['size']: run for run in base['runs']}
+        for run in result['runs']:
+            base_run = base_runs.get(run['size'])
+            if base_run and run['seconds'] > time_tolerance * base_run['seconds']:
+                regressions.append(f"{name} n={run['size']}: {run['seconds']:.4f}s vs baseline "
+                                   f"{base_run['seconds']:.4f}s")
+        if (result['scaling_exponent'] is not None and base['scaling_exponent'] is not None
+                and result['scaling_exponent'] > base['scaling_exponent'] + exponent_tolerance):
+            regressions.append(f"{name}: scaling exponent {result['scaling_exponent']:.2f} vs baseline "
+                               f"{base['scaling_exponent']:.2f}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time every scheduling algorithm on synthetic workloads.")
+    parser.add_argument('--algorithms', nargs='+', default=list(BENCHMARKS), choices=list(BENCHMARKS))
+    parser.add_argument('--min-exponent', type=int, default=3, help="smallest workload is 10**N processes")
+    parser.add_argument('--max-exponent', type=int, default=5, help="largest workload is 10**N processes (up to 7)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--time-limit', type=float, default=60.0,
+                        help="skip larger sizes of an algorithm once one run takes longer than this")
+    parser.add_argument('--no-memory', action='store_true', help="skip the peak memory runs")
+    parser.add_argument('--save', metavar='BASELINE', help="write the results as a JSON baseline")
+    parser.add_argument('--compare', metavar='BASELINE', help="flag regressions against a JSON baseline")
+    parser.add_argument('--tolerance', type=float, default=1.5, help="allowed slowdown factor for --compare")
+    args = parser.parse_args(argv)
+
+    sizes = [10 ** exponent for exponent in range(args.min_exponent, args.max_exponent + 1)]
+    results = run_benchmarks(args.algorithms, sizes, args.seed, args.time_limit, not args.no_memory)
+    for name, result in results.items():
+        exponent = result['scaling_exponent']
+        print(f"{name:<24} scaling exponent {exponent:.2f}" if exponent is not None else
+              f"{name:<24} scaling exponent n/a")
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump({'python': platform.python_version(), 'seed': args.seed, 'results': results}, file, indent=1)
+        print(f"Baseline saved to {args.save}")
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)['results']
+        regressions = find_regressions(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
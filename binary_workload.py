@@ -0,0 +1,89 @@
+import argparse
+import mmap
+import struct
+import sys
+from array import array
+
+from process_table import INPUT_COLUMNS, ITEM_SIZE, TYPECODE, ProcessTable
+
+# Header: magic, version, number of columns, number of processes.
+# It is followed by the columns one after another as little-endian int64.
+MAGIC = b'PTBL'
+VERSION = 1
+HEADER = struct.Struct('<4sHHQ')
+
+
+def _column_bytes(values):
+    if sys.byteorder != 'little':
+        values = array(TYPECODE, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def write_binary_workload(file_path, chunks, count):
+    # chunks: ProcessTable chunks with `count` rows in total, written column by column
+    with open(file_path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(INPUT_COLUMNS), count))
+        written = 0
+        for chunk in chunks:
+            for position, column in enumerate(INPUT_COLUMNS):
+                file.seek(HEADER.size + (position * count + written) * ITEM_SIZE)
+                file.write(_column_bytes(getattr(chunk, column)))
+            written += len(chunk)
+        if written != count:
+            raise ValueError(f"expected {count} processes, got {written}")
+
+
+def convert_text_workload(text_path, binary_path, chunk_size=65536):
+    from main import iter_process_chunks, iter_process_records, report_invalid_lines
+
+    # Two passes over the text so the converter never holds more than one chunk
+    errors = []
+    count = 0
+    for _, arrival_time, burst_time, _ in iter_process_records(text_path, errors):
+        if type(arrival_time) is not int or type(burst_time) is not int:
+            raise ValueError(f"{text_path}: binary workloads hold integer times, "
+                             f"write fractional times in a finer unit (e.g. nanoseconds)")
+        count += 1
+    report_invalid_lines(text_path, errors)
+    write_binary_workload(binary_path, iter_process_chunks(text_path, chunk_size), count)
+    return count
+
+
+def load_binary_workload(file_path):
+    with open(file_path, 'rb') as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(mapped) < HEADER.size:
+        raise ValueError(f"{file_path}: file is too short for a workload header")
+    magic, version, column_count, count = HEADER.unpack_from(mapped)
+    if magic != MAGIC or version != VERSION or column_count != len(INPUT_COLUMNS):
+        raise ValueError(f"{file_path}: not a version {VERSION} binary workload")
+    if len(mapped) != HEADER.size + column_count * count * ITEM_SIZE:
+        raise ValueError(f"{file_path}: expected {count} processes, file size does not match")
+
+    table = ProcessTable()
+    table.reset()  # Result columns are only allocated when a run needs them
+    view = memoryview(mapped)
+    for position, column in enumerate(INPUT_COLUMNS):
+        start = HEADER.size + position * count * ITEM_SIZE
+        data = view[start:start + count * ITEM_SIZE]
+        if sys.byteorder == 'little':
+            values = data.cast(TYPECODE)  # Zero-copy, read-only view of the mapped file
+        else:
+            values = array(TYPECODE, data.tobytes())
+            values.byteswap()
+        setattr(table, column, values)
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert a text workload into the binary workload format.")
+    parser.add_argument('text_path')
+    parser.add_argument('binary_path')
+    args = parser.parse_args()
+    count = convert_text_workload(args.text_path, args.binary_path)
+    print(f"Wrote {count} processes to {args.binary_path}")
+
+
+if __name__ == "__main__":
+    main()
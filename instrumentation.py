@@ -0,0 +1,41 @@
+import time
+from contextlib import contextmanager
+
+
+class Instrumentation:
+    # Opt-in counters and per-phase wall times; when disabled nothing is recorded
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.counters = {}
+        self.timings = {}
+
+    def stats(self):
+        # Value for the algorithms' stats argument: None lets them skip publishing counters
+        return self.counters if self.enabled else None
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+
+    def dump(self, title):
+        if not self.enabled:
+            return
+        print(f"\nInstrumentation {title}:")
+        for name, value in sorted(self.counters.items()):
+            print(f"  {name}: {value}")
+        for name, seconds in self.timings.items():
+            print(f"  {name} time: {seconds:.6f}s")
+
+
+def percentile(sorted_values, percent):
+    # Nearest-rank percentile of an already sorted sequence
+    if not sorted_values:
+        return 0
+    return sorted_values[max(0, -(-percent * len(sorted_values) // 100) - 1)]
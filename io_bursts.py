@@ -0,0 +1,135 @@
+import argparse
+import inspect
+
+from batch import parse_param_grid
+from main import ALGORITHMS, JobColumns, Process, average_turnaround_time, average_waiting_time, report_invalid_lines
+from process_table import parse_time
+
+# I/O returns are arrivals that only become known while the run is in progress. Every engine in
+# main.py admits jobs from a shared arrival queue that accepts such arrivals mid-run, so all of
+# its single-CPU policies can schedule bursts; multicore has its own dispatch loop.
+IO_POLICIES = tuple(name for name in ALGORITHMS if name != 'multicore')
+
+
+class BurstProcess(Process):
+    # A process alternating CPU and I/O: bursts = (cpu, io, cpu, ..., cpu). burst_time is the
+    # total CPU time, so waiting_time = turnaround - CPU - I/O is the time spent ready but not running.
+    __slots__ = ('bursts', 'io_time')
+
+    def __init__(self, process_id, arrival_time, bursts, priority=0):
+        if len(bursts) % 2 == 0:
+            raise ValueError(f"process {process_id}: bursts must start and end with a CPU burst")
+        super().__init__(process_id, arrival_time, sum(bursts[0::2]), priority)
+        self.bursts = tuple(bursts)
+        self.io_time = sum(bursts[1::2])
+
+
+class _BurstJobs(JobColumns):
+    # One job per CPU burst, process by process, so the burst after job i is job i + 1. A first
+    # burst arrives with its process; a later one starts out at the earliest time it could be
+    # ready and is released when the I/O before it finishes.
+
+    def __init__(self, processes):
+        ids, arrival, burst, priority, first = [], [], [], [], []
+        self.owner = []
+        self.io = []  # I/O after each job, None after the last burst of a process
+        for process in processes:
+            first.append(len(ids))
+            ready_time = process.arrival_time
+            for index in range(0, len(process.bursts), 2):
+                ids.append(process.process_id)
+                arrival.append(ready_time)
+                burst.append(process.bursts[index])
+                priority.append(process.priority)
+                self.owner.append(process)
+                self.io.append(process.bursts[index + 1] if index + 1 < len(process.bursts) else None)
+                if self.io[-1] is not None:
+                    ready_time += process.bursts[index] + self.io[-1]
+        super().__init__(ids, arrival, burst, priority, first)
+        self.io_returns = 0
+
+    def complete(self, i, time):
+        if self.io[i] is not None:
+            self.io_returns += 1
+            self.release(i + 1, time + self.io[i])
+            return
+        process = self.owner[i]
+        process.remaining_time = 0
+        process.completion_time = time
+        process.turnaround_time = process.completion_time - process.arrival_time
+        process.waiting_time = process.turnaround_time - process.burst_time - process.io_time
+
+
+def parse_burst_line(line):
+    # process_id arrival_time priority cpu [io cpu]...
+    fields = line.split()
+    if len(fields) < 4:
+        raise ValueError(f"expected at least 4 columns, got {len(fields)}")
+    process_id, priority = int(fields[0]), int(fields[2])
+    return BurstProcess(process_id, parse_time(fields[1]), [parse_time(field) for field in fields[3:]], priority)
+
+
+def get_burst_processes_from_file(file_path):
+    processes = []
+    errors = []
+    with open(file_path, 'r') as file:
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                processes.append(parse_burst_line(line))
+            except ValueError:
+                errors.append((line_number, line.rstrip('\n')))
+    report_invalid_lines(file_path, errors)
+    return processes
+
+
+def simulate_bursts(processes, policy, time_quantum=None, stats=None, **params):
+    # Each CPU burst is a job for the policy's engine in main.py: when a burst completes, the
+    # next one is released into the engine's arrival queue for the time its I/O finishes.
+    # Cost follows the number of bursts and preemptions, not the elapsed time.
+    if policy not in IO_POLICIES:
+        raise ValueError(f"unknown policy {policy!r}, expected one of {', '.join(IO_POLICIES)}")
+    function = ALGORITHMS[policy][0]
+    accepted = inspect.signature(function).parameters
+    unknown = [name for name in params if name not in accepted or name in ('processes', 'timeline', 'stats')]
+    if unknown:
+        raise ValueError(f"{policy} does not take {', '.join(unknown)}")
+    if time_quantum is not None and 'time_quantum' in accepted:
+        params['time_quantum'] = time_quantum
+    if policy == 'rr' and not params.get('time_quantum'):
+        raise ValueError("round robin needs a positive time_quantum")
+    jobs = _BurstJobs(processes)
+    function(jobs, stats=stats, **params)
+    if stats is not None:
+        stats.update(bursts=len(jobs), io_returns=jobs.io_returns, makespan=max(jobs.completion, default=0))
+    return processes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Schedule processes that alternate CPU and I/O bursts.")
+    parser.add_argument('input_file', help="lines of: process_id arrival_time priority cpu [io cpu]...")
+    parser.add_argument('--policy', default='fcfs', choices=IO_POLICIES)
+    parser.add_argument('--quantum', type=parse_time, help="time quantum for rr, stride and lottery")
+    parser.add_argument('--param', action='append', default=[], metavar='NAME=VALUE',
+                        help="extra engine parameter, e.g. aging_interval=10 or quanta=4:8:16 (repeatable)")
+    args = parser.parse_args()
+    grid = parse_param_grid(args.param)
+    if any(len(values) > 1 for values in grid.values()):
+        parser.error("--param takes a single value per parameter")
+
+    stats = {}
+    processes = simulate_bursts(get_burst_processes_from_file(args.input_file), args.policy, args.quantum, stats,
+                                **{name: values[0] for name, values in grid.items()})
+    print(f"ProcessID\tArrivalTime\tCPUTime\t\tIOTime\t\tCompletionTime\tTurnaroundTime\tWaitingTime")
+    for process in processes:
+        print(f"{process.process_id}\t\t\t{process.arrival_time}\t\t\t{process.burst_time}\t\t\t{process.io_time}"
+              f"\t\t\t{process.completion_time}\t\t\t\t{process.turnaround_time}\t\t\t\t{process.waiting_time}")
+    print(f"\nAverage Waiting Time: {average_waiting_time(processes)}")
+    print(f"Average Turnaround Time: {average_turnaround_time(processes)}")
+    for name, value in stats.items():
+        print(f"{name}: {value}")
+
+
+if __name__ == "__main__":
+    main()
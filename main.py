@@ -1,8 +1,38 @@
+import bisect
+import glob
+import heapq
+import math
 import os
+import random
+import sys
+from array import array
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+from functools import partial
+from multiprocessing import shared_memory
+
+from binary_workload import load_binary_workload
+from process_table import COLUMNS, INPUT_COLUMNS, ITEM_SIZE, TYPECODE, ProcessTable, fits_table, parse_time
+from instrumentation import Instrumentation, percentile
+from multicore import simulate_multicore
+from result_cache import ResultCache
+from result_store import ResultStore
+from timeline import Timeline, render_gantt
+
+try:
+    import numpy as np
+except ImportError:  # NumPy là tùy chọn; không có nó thì dùng vòng lặp Python
+    np = None
+
+# Inputs at least this large go through the NumPy kernel when NumPy is installed
+VECTORIZE_THRESHOLD = 10000
 
 
 class Process:
+    __slots__ = ('process_id', 'arrival_time', 'burst_time', 'priority', 'completion_time', 'waiting_time',
+                 'turnaround_time', 'remaining_time')
+
     def __init__(self, process_id, arrival_time, burst_time, priority):
         self.process_id = process_id
         self.arrival_time = arrival_time
@@ -14,217 +44,1168 @@ class Process:
         self.remaining_time = burst_time
 
 
-def fcfs(processes):
-    processes.sort(key=lambda x: x.arrival_time)  # Sắp xếp tiến trình theo thời gian xuất hiện
-    curr_time = 0
-    for process in processes:
-        if process.arrival_time > curr_time:
-            curr_time = process.arrival_time
-        process.completion_time = curr_time + process.burst_time
-        process.turnaround_time = process.completion_time - process.arrival_time
-        process.waiting_time = process.turnaround_time - process.burst_time
-        curr_time = process.completion_time
+def _columns_as_arrays(processes):
+    if isinstance(processes, ProcessTable):
+        return {column: np.frombuffer(getattr(processes, column), dtype=np.int64) for column in COLUMNS}
+    return {
+        'ids': np.fromiter((int(p.process_id) for p in processes), dtype=np.int64, count=len(processes)),
+        'arrival': np.fromiter((p.arrival_time for p in processes), dtype=np.int64, count=len(processes)),
+        'burst': np.fromiter((p.burst_time for p in processes), dtype=np.int64, count=len(processes)),
+        'priority': np.fromiter((p.priority if p.priority != '' else 0 for p in processes), dtype=np.int64,
+                                count=len(processes)),
+    }
+
+
+class _Arrivals:
+    # Event queue of arrivals shared by the engines: positions sorted by arrival time up front,
+    # merged with a heap of (time, position) for jobs released while the run is in progress.
+    # next_time is math.inf once no arrival is left; ties go to the lower position.
+    __slots__ = ('arrival', 'order', 'position', 'released', 'next_time')
+
+    def __init__(self, arrival, order):
+        self.arrival = arrival
+        self.order = order
+        self.position = 0
+        self.released = []
+        self.next_time = arrival[order[0]] if order else math.inf
+
+    def pop(self):
+        # Position of the earliest arrival; call only when next_time is not math.inf
+        order, released = self.order, self.released
+        i = order[self.position] if self.position < len(order) else None
+        if i is not None and (not released or (self.arrival[i], i) < released[0]):
+            self.position += 1
+        else:
+            i = heapq.heappop(released)[1]
+        next_time = self.arrival[order[self.position]] if self.position < len(order) else math.inf
+        self.next_time = min(next_time, released[0][0]) if released else next_time
+        return i
+
+    def release(self, i, time):
+        # Job i arrives at `time`, which is not before the current time of the run
+        self.arrival[i] = time
+        heapq.heappush(self.released, (time, i))
+        self.next_time = min(self.next_time, time)
+
+
+class JobColumns:
+    # Columns of jobs that the engines run in place of a process list when arrivals only
+    # become known during the run, e.g. CPU bursts coming back from I/O. The jobs at positions
+    # `first` arrive at their arrival time, the others when release() is called. Engines call
+    # complete(i, time) at every completion, which may release more jobs. Results stay in the
+    # completion column.
+
+    def __init__(self, ids, arrival, burst, priority, first):
+        self.ids = ids
+        self.arrival = arrival
+        self.burst = burst
+        self.priority = priority
+        self.remaining = list(burst)
+        self.completion = [0] * len(ids)
+        self.arrivals = _Arrivals(arrival, sorted(first, key=arrival.__getitem__))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def release(self, i, time):
+        self.arrivals.release(i, time)
+
+    def complete(self, i, time):
+        pass
+
+
+def _process_columns(processes):
+    # (ids, arrival, burst, priority, remaining, completion) indexed by position. A ProcessTable
+    # hands over its own columns, so nothing is copied and results land in place; a list of
+    # Process is read once into plain lists.
+    if isinstance(processes, (ProcessTable, JobColumns)):
+        return (processes.ids, processes.arrival, processes.burst, processes.priority, processes.remaining,
+                processes.completion)
+    return ([process.process_id for process in processes], [process.arrival_time for process in processes],
+            [process.burst_time for process in processes], [process.priority for process in processes],
+            [process.remaining_time for process in processes], [0] * len(processes))
+
+
+def _arrival_events(processes, arrival):
+    # The arrival queue to admit from and the hook to call at each completion (None when every
+    # arrival is known up front)
+    if isinstance(processes, JobColumns):
+        return processes.arrivals, processes.complete
+    return _Arrivals(arrival, sorted(range(len(arrival)), key=arrival.__getitem__)), None
+
+
+def _store_results(processes, finished, arrival, burst, completion):
+    # Fill in the results of the finished processes (positions in `processes`)
+    if isinstance(processes, JobColumns):
+        return
+    if isinstance(processes, ProcessTable):
+        turnaround, waiting = processes.turnaround, processes.waiting
+        for i in finished:
+            turnaround[i] = completion[i] - arrival[i]
+            waiting[i] = turnaround[i] - burst[i]
+        return
+    for i in finished:
+        process = processes[i]
+        process.remaining_time = 0
+        process.completion_time = completion[i]
+        process.turnaround_time = completion[i] - arrival[i]
+        process.waiting_time = process.turnaround_time - burst[i]
+
+
+def _in_finish_order(processes, finished):
+    # Kết quả theo thứ tự hoàn thành: the table is permuted in place, a list is rebuilt
+    if isinstance(processes, JobColumns):
+        return processes
+    if isinstance(processes, ProcessTable):
+        processes.permute(finished)
+        return processes
+    return [processes[i] for i in finished]
+
+
+def _run_in_order_vectorized(processes, sort_columns, timeline=None, stats=None):
+    # Same schedule as the fcfs loop: with S the running sum of bursts in
+    # dispatch order, completion = S + running max of (arrival - S before it, 0).
+    columns = _columns_as_arrays(processes)
+    order = np.lexsort([columns[name] for name in reversed(sort_columns)])
+    arrival = columns['arrival'][order]
+    burst = columns['burst'][order]
+    finished_work = np.cumsum(burst)
+    idle = np.maximum.accumulate(np.maximum(arrival - (finished_work - burst), 0))
+    completion = finished_work + idle
+    turnaround = completion - arrival
+    waiting = turnaround - burst
+    if timeline is not None:
+        ran = burst > 0
+        timeline.extend_from_bytes((completion - burst)[ran].tobytes(), completion[ran].tobytes(),
+                                   columns['ids'][order][ran].tobytes())
+    if stats is not None:
+        idle_gaps = np.diff(idle, prepend=0)
+        stats.update(vectorized=1, sorts=1, loop_iterations=0, context_switches=max(0, len(order) - 1),
+                     idle_jumps=int(np.count_nonzero(idle_gaps)), idle_time=int(idle[-1]) if len(idle) else 0)
+
+    if isinstance(processes, ProcessTable):
+        for name, values in columns.items():
+            setattr(processes, name, array(TYPECODE, values[order].tobytes()))
+        processes.completion = array(TYPECODE, completion.tobytes())
+        processes.turnaround = array(TYPECODE, turnaround.tobytes())
+        processes.waiting = array(TYPECODE, waiting.tobytes())
+        return processes
+
+    processes[:] = [processes[i] for i in order.tolist()]
+    for process, completion_time, turnaround_time, waiting_time in zip(
+            processes, completion.tolist(), turnaround.tolist(), waiting.tolist()):
+        process.completion_time = completion_time
+        process.turnaround_time = turnaround_time
+        process.waiting_time = waiting_time
     return processes
 
 
-def sjf_non_preemptive(processes):
-    processes.sort(
-        key=lambda x: (x.burst_time, x.arrival_time))  # Sắp xếp tiến trình theo burst time và thời gian xuất hiện
+def _run_in_order(processes, timeline=None, stats=None):
+    # Run already-sorted processes one after another without preemption
     curr_time = 0
+    idle_jumps = 0
+    idle_time = 0
     for process in processes:
         if process.arrival_time > curr_time:
+            idle_jumps += 1
+            idle_time += process.arrival_time - curr_time
             curr_time = process.arrival_time
         process.completion_time = curr_time + process.burst_time
+        if timeline is not None:
+            timeline.add(curr_time, process.completion_time, process.process_id)
         process.turnaround_time = process.completion_time - process.arrival_time
         process.waiting_time = process.turnaround_time - process.burst_time
         curr_time = process.completion_time
+    if stats is not None:
+        stats.update(sorts=1, loop_iterations=len(processes), context_switches=max(0, len(processes) - 1),
+                     idle_jumps=idle_jumps, idle_time=idle_time)
     return processes
 
 
-def round_robin(processes, time_quantum):
+def fcfs(processes, timeline=None, stats=None):
+    if isinstance(processes, JobColumns):
+        return _run_arrival_aware(processes, 'arrival', timeline, stats)  # Arrivals are not known up front
+    if np is not None and len(processes) >= VECTORIZE_THRESHOLD and fits_table(processes):
+        return _run_in_order_vectorized(processes, ['arrival'], timeline, stats)
+    processes.sort(key=lambda x: x.arrival_time)  # Sắp xếp tiến trình theo thời gian xuất hiện
+    return _run_in_order(processes, timeline, stats)
+
+
+def _run_arrival_aware(processes, key_column, timeline=None, stats=None):
+    # Non-preemptive: at every dispatch pick, among the processes that have already arrived,
+    # the one with the smallest key (ties: arrival, then list position). Idle gaps are jumped.
+    ids, arrival, burst, priority, _, completion = _process_columns(processes)
+    keys = {'arrival': arrival, 'burst': burst, 'priority': priority}[key_column]
+    arrivals, complete = _arrival_events(processes, arrival)
+    count = len(arrival)
+
+    ready = []  # Heap of (key, arrival, index) for processes that have arrived
+    order = []
     curr_time = 0
-    queue = deque(processes)
-    completed_processes = []
-    while queue:
-        process = queue.popleft()
-        if process.remaining_time <= time_quantum:
-            curr_time += process.remaining_time
-            process.remaining_time = 0
-            process.completion_time = curr_time
-            process.turnaround_time = process.completion_time - process.arrival_time
-            process.waiting_time = process.turnaround_time - process.burst_time
-            completed_processes.append(process)
+    idle_jumps = 0
+    idle_time = 0
+    while len(order) < count:
+        if not ready and arrivals.next_time > curr_time:
+            idle_jumps += 1
+            idle_time += arrivals.next_time - curr_time
+            curr_time = arrivals.next_time
+        while arrivals.next_time <= curr_time:
+            i = arrivals.pop()
+            heapq.heappush(ready, (keys[i], arrival[i], i))
+        i = heapq.heappop(ready)[2]
+        order.append(i)
+        completion[i] = curr_time + burst[i]
+        if timeline is not None:
+            timeline.add(curr_time, completion[i], ids[i])
+        curr_time = completion[i]
+        if complete is not None:
+            complete(i, curr_time)
+    if stats is not None:
+        stats.update(sorts=1, loop_iterations=count, heap_operations=2 * count,
+                     context_switches=max(0, count - 1), idle_jumps=idle_jumps, idle_time=idle_time)
+
+    # Kết quả theo thứ tự được chạy, như trước
+    _store_results(processes, order, arrival, burst, completion)
+    if isinstance(processes, list):
+        processes[:] = [processes[i] for i in order]
+        return processes
+    return _in_finish_order(processes, order)
+
+
+def sjf_non_preemptive(processes, timeline=None, stats=None):
+    return _run_arrival_aware(processes, 'burst', timeline, stats)
+
+
+def _whole_slices(span, time_quantum):
+    # Number of full quanta that end strictly before `span` runs out
+    return max(0, -(-span // time_quantum) - 1)
+
+
+def round_robin(processes, time_quantum, timeline=None, stats=None):
+    ids, arrival, burst, _, remaining, completion = _process_columns(processes)
+    arrivals, complete = _arrival_events(processes, arrival)  # Theo thời gian xuất hiện
+    count = len(arrival)
+    queue = deque()
+    finished = []
+    curr_time = 0
+    loop_iterations = queue_operations = context_switches = preemptions = idle_jumps = idle_time = 0
+    last_process = None
+    while len(finished) < count:
+        loop_iterations += 1
+        while arrivals.next_time <= curr_time:
+            queue.append(arrivals.pop())
+            queue_operations += 1
+        if not queue:
+            idle_jumps += 1
+            idle_time += arrivals.next_time - curr_time
+            curr_time = arrivals.next_time  # Skip the idle gap
+            continue
+
+        i = queue.popleft()
+        queue_operations += 1
+        if i != last_process:
+            context_switches += last_process is not None
+            last_process = i
+        if not queue and remaining[i] > time_quantum:
+            # Only one process is ready: merge the quanta that end before the next arrival
+            slices = _whole_slices(remaining[i], time_quantum)
+            if arrivals.next_time != math.inf:
+                slices = min(slices, _whole_slices(arrivals.next_time - curr_time, time_quantum))
+            if timeline is not None:
+                timeline.add(curr_time, curr_time + slices * time_quantum, ids[i])
+            curr_time += slices * time_quantum
+            remaining[i] -= slices * time_quantum
+
+        if timeline is not None:
+            timeline.add(curr_time, curr_time + min(remaining[i], time_quantum), ids[i])
+        if remaining[i] <= time_quantum:
+            curr_time += remaining[i]
+            remaining[i] = 0
+            completion[i] = curr_time
+            finished.append(i)
+            if complete is not None:
+                complete(i, curr_time)
         else:
             curr_time += time_quantum
-            process.remaining_time -= time_quantum
-            queue.append(process)
-    return completed_processes
+            remaining[i] -= time_quantum
+            queue.append(i)
+            queue_operations += 1
+            preemptions += 1
+    if stats is not None:
+        stats.update(sorts=1, loop_iterations=loop_iterations, queue_operations=queue_operations,
+                     context_switches=context_switches, preemptions=preemptions, idle_jumps=idle_jumps,
+                     idle_time=idle_time)
+    _store_results(processes, finished, arrival, burst, completion)
+    return _in_finish_order(processes, finished)
+
+
+def _round_robin_turnaround(arrival, burst, time_quantum, curr_time, next_arrival, queue, total_turnaround):
+    # Continue a round robin run on arrival-sorted columns from the given state; queue holds
+    # (position, remaining_time) pairs. Returns the summed turnaround time.
+    while next_arrival < len(arrival) or queue:
+        while next_arrival < len(arrival) and arrival[next_arrival] <= curr_time:
+            queue.append((next_arrival, burst[next_arrival]))
+            next_arrival += 1
+        if not queue:
+            curr_time = arrival[next_arrival]
+            continue
+
+        i, remaining_time = queue.popleft()
+        if not queue and remaining_time > time_quantum:
+            slices = _whole_slices(remaining_time, time_quantum)
+            if next_arrival < len(arrival):
+                slices = min(slices, _whole_slices(arrival[next_arrival] - curr_time, time_quantum))
+            curr_time += slices * time_quantum
+            remaining_time -= slices * time_quantum
+
+        if remaining_time <= time_quantum:
+            curr_time += remaining_time
+            total_turnaround += curr_time - arrival[i]
+        else:
+            curr_time += time_quantum
+            queue.append((i, remaining_time - time_quantum))
+    return total_turnaround
+
+
+def round_robin_quantum_sweep(processes, quanta):
+    # Average waiting and turnaround time of round_robin for every quantum in one pass.
+    # Schedules for a group of quanta are identical until a slice whose remaining burst is
+    # longer than the smallest quantum; the quanta that would preempt it split off there.
+    _, arrival, burst, _, _, _ = _process_columns(processes)
+    order = sorted(range(len(arrival)), key=arrival.__getitem__)
+    arrival = [arrival[i] for i in order]
+    burst = [burst[i] for i in order]
+    totals = {}
+    states = [(sorted(set(quanta)), 0, 0, deque(), 0)] if quanta else []
+    while states:
+        group, curr_time, next_arrival, queue, total_turnaround = states.pop()
+        if len(group) == 1:
+            totals[group[0]] = _round_robin_turnaround(arrival, burst, group[0], curr_time, next_arrival, queue,
+                                                       total_turnaround)
+            continue
+
+        while next_arrival < len(arrival) or queue:
+            while next_arrival < len(arrival) and arrival[next_arrival] <= curr_time:
+                queue.append((next_arrival, burst[next_arrival]))
+                next_arrival += 1
+            if not queue:
+                curr_time = arrival[next_arrival]
+                continue
 
+            i, remaining_time = queue.popleft()
+            split = bisect.bisect_left(group, remaining_time)
+            for time_quantum in group[:split]:
+                forked_queue = deque(queue)
+                forked_queue.append((i, remaining_time - time_quantum))
+                states.append(([time_quantum], curr_time + time_quantum, next_arrival, forked_queue,
+                               total_turnaround))
+            group = group[split:]
+            if not group:
+                break
+            curr_time += remaining_time
+            total_turnaround += curr_time - arrival[i]
+        else:
+            for time_quantum in group:
+                totals[time_quantum] = total_turnaround
 
-def priority_preemptive(processes):
-    def find_max_prior_arrived(currTime, lst):
-        available_processes = [process for process in lst if
-                               process.arrival_time <= currTime and process.remaining_time > 0]
-        if available_processes:
-            available_processes.sort(key=lambda x: x.priority)
-            return available_processes[0], True
-        return None, False
+    total_burst = sum(burst)
+    count = len(processes) or 1
+    return [(time_quantum, (totals[time_quantum] - total_burst) / count, totals[time_quantum] / count)
+            for time_quantum in sorted(totals)]
 
-    def all_done(lst):
-        return all(process.remaining_time == 0 for process in lst)
 
+def mlfq(processes, quanta=(4, 8, 16), boost_interval=None, timeline=None, stats=None):
+    # Multilevel feedback queue: new processes start on level 0, a process that uses up its
+    # level's quantum moves one level down, and every boost_interval all processes go back to
+    # level 0. Arrivals preempt processes below level 0; the last level is round robin.
+    ids, arrival, burst, _, remaining, completion = _process_columns(processes)
+    arrivals, complete = _arrival_events(processes, arrival)  # Theo thời gian xuất hiện
+    count = len(arrival)
+    bottom = len(quanta) - 1
+    level = [0] * count
+    budget = [quanta[0]] * count  # What is left of the current quantum
+    epoch = [0] * count  # Boost epoch the level and budget belong to
+    boost_epoch = 0
+    top = deque([deque()])  # Level 0 as a chain of deques: a boost moves whole levels up in O(levels)
+    lower = [deque() for _ in quanta[1:]]
+    queued = 0
+    next_boost = boost_interval or None
     curr_time = 0
-    while not all_done(processes):
-        process, has_arrived = find_max_prior_arrived(curr_time, processes)
-        if not has_arrived:
-            curr_time += 1
+    finished = []
+    loop_iterations = queue_operations = context_switches = preemptions = demotions = boosts = 0
+    idle_jumps = idle_time = 0
+    last_process = None
+    while len(finished) < count:
+        loop_iterations += 1
+        while arrivals.next_time <= curr_time:
+            top[-1].append(arrivals.pop())
+            queue_operations += 1
+            queued += 1
+        if next_boost is not None and curr_time >= next_boost:
+            # Priority boost: lower levels join level 0 behind it, budgets reset lazily via the epoch
+            top.extend(lower)
+            top.append(deque())
+            lower = [deque() for _ in quanta[1:]]
+            boost_epoch += 1
+            boosts += 1
+            # Next multiple of boost_interval after curr_time; with floats the floor can
+            # come out one short and land on curr_time itself
+            boost_number = int(curr_time // boost_interval) + 1
+            while boost_number * boost_interval <= curr_time:
+                boost_number += 1
+            next_boost = boost_number * boost_interval
+        if not queued:
+            idle_jumps += 1
+            idle_time += arrivals.next_time - curr_time
+            curr_time = arrivals.next_time  # Skip the idle gap
             continue
 
-        process.remaining_time -= 1
-        curr_time += 1
-        if process.remaining_time == 0:
-            process.completion_time = curr_time
-            process.turnaround_time = process.completion_time - process.arrival_time
-            process.waiting_time = process.turnaround_time - process.burst_time
+        while not top[0]:
+            if len(top) == 1:
+                break
+            top.popleft()
+        if top[0]:
+            i = top[0].popleft()
+            if epoch[i] != boost_epoch:
+                level[i], budget[i], epoch[i] = 0, quanta[0], boost_epoch
+        else:
+            i = next(queue for queue in lower if queue).popleft()
+        queue_operations += 1
+        queued -= 1
+        if i != last_process:
+            context_switches += last_process is not None
+            last_process = i
+
+        # Run length as a duration, not a stop time: with float times a budget left over
+        # from an earlier slice must still be used up even when curr_time cannot resolve it
+        next_time = arrivals.next_time if arrivals.next_time != math.inf else None
+        ran = min(remaining[i], budget[i])
+        if not queued and level[i] == bottom and remaining[i] > budget[i]:
+            # Lone process on the last level: merge its quanta until something else needs the CPU
+            ran = remaining[i]
+            if bottom == 0 and next_time is not None:
+                ran = min(ran, budget[i] + max(0, -(-(next_time - curr_time - budget[i]) // quanta[0])) * quanta[0])
+        if level[i] > 0 and next_time is not None and next_time - curr_time < ran:
+            ran = next_time - curr_time  # A new arrival on level 0 preempts
+        if next_boost is not None and next_boost - curr_time < ran:
+            ran = next_boost - curr_time
+        stop = curr_time + ran
+        if timeline is not None:
+            timeline.add(curr_time, stop, ids[i])
+        remaining[i] -= ran
+        curr_time = stop
 
-    return processes
+        if remaining[i] == 0:
+            completion[i] = curr_time
+            finished.append(i)
+            if complete is not None:
+                complete(i, curr_time)
+            continue
+        if ran < budget[i]:
+            # Preempted inside its quantum: back to the front of its level with what is left
+            budget[i] -= ran
+            (top[0] if level[i] == 0 else lower[level[i] - 1]).appendleft(i)
+            preemptions += 1
+        else:
+            extra = (ran - budget[i]) % quanta[level[i]]
+            if extra:
+                budget[i] = quanta[level[i]] - extra
+                (top[0] if level[i] == 0 else lower[level[i] - 1]).appendleft(i)
+                preemptions += 1
+            else:
+                if level[i] < bottom:
+                    level[i] += 1
+                    demotions += 1
+                budget[i] = quanta[level[i]]
+                (top[-1] if level[i] == 0 else lower[level[i] - 1]).append(i)
+        queue_operations += 1
+        queued += 1
+    if stats is not None:
+        stats.update(sorts=1, loop_iterations=loop_iterations, queue_operations=queue_operations,
+                     context_switches=context_switches, preemptions=preemptions, demotions=demotions,
+                     boosts=boosts, idle_jumps=idle_jumps, idle_time=idle_time)
+    _store_results(processes, finished, arrival, burst, completion)
+    return _in_finish_order(processes, finished)
+
+
+# Linux nice-to-weight table for nice -20 ... 19; priority p is treated as nice p, clamped to that range
+PRIO_TO_WEIGHT = (
+    88761, 71755, 56483, 46273, 36291, 29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906, 3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423, 335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45, 36, 29, 23, 18, 15,
+)
+NICE_0_WEIGHT = 1024
+
+
+def _time_unit(times):
+    # Largest time that all `times` are whole multiples of (1 if they are all 0); floats count
+    # with their exact binary value
+    times = list(times)
+    if all(type(time) is int for time in times):
+        return math.gcd(*times) or 1
+    unit = Fraction(0)
+    for time in times:
+        time = Fraction(time)
+        unit = Fraction(math.gcd(unit.numerator * time.denominator, time.numerator * unit.denominator),
+                        unit.denominator * time.denominator)
+    return unit or 1
+
+
+def _priority_weight(priority):
+    return PRIO_TO_WEIGHT[min(max(priority if priority != '' else 0, -20), 19) + 20]
 
 
-def priority_non_preemptive(processes):
-    processes.sort(key=lambda x: (x.priority, x.arrival_time))  # Sắp xếp tiến trình theo ưu tiên và thời gian xuất hiện
+def _run_weighted(processes, make_queue, min_slice, timeline=None, stats=None):
+    # Shared loop of cfs, stride and lottery: the queue picks who runs next, sizes its slice and
+    # takes it back; arrivals, idle gaps, a lone process and completions are handled here
+    ids, arrival, burst, priority, remaining, completion = _process_columns(processes)
+    arrivals, complete = _arrival_events(processes, arrival)  # Theo thời gian xuất hiện
+    count = len(arrival)
+    queue = make_queue([_priority_weight(p) for p in priority])
+    add, pick, time_slice, requeue, remove = queue.add, queue.pick, queue.time_slice, queue.requeue, queue.remove
+    runnable = 0
     curr_time = 0
-    for process in processes:
-        if process.arrival_time > curr_time:
-            curr_time = process.arrival_time
-        process.completion_time = curr_time + process.burst_time
-        process.turnaround_time = process.completion_time - process.arrival_time
-        process.waiting_time = process.turnaround_time - process.burst_time
-        curr_time = process.completion_time
+    finished = []
+    loop_iterations = context_switches = preemptions = idle_jumps = idle_time = 0
+    last_process = None
+    while len(finished) < count:
+        loop_iterations += 1
+        while arrivals.next_time <= curr_time:
+            add(arrivals.pop())
+            runnable += 1
+        if not runnable:
+            idle_jumps += 1
+            idle_time += arrivals.next_time - curr_time
+            curr_time = arrivals.next_time  # Skip the idle gap
+            continue
+
+        i = pick()
+        if i != last_process:
+            context_switches += last_process is not None
+            last_process = i
+        if runnable > 1:
+            stop = curr_time + min(remaining[i], time_slice(i))
+        else:
+            # Alone: run until it finishes or someone arrives, instead of slice after slice
+            stop = curr_time + remaining[i]
+            if arrivals.next_time != math.inf:
+                stop = min(stop, max(arrivals.next_time, curr_time + min_slice))
+        if timeline is not None:
+            timeline.add(curr_time, stop, ids[i])
+        ran = stop - curr_time
+        remaining[i] = curr_time + remaining[i] - stop  # Exactly 0 at the finish, even for floats
+        curr_time = stop
+
+        if remaining[i] == 0:
+            completion[i] = curr_time
+            finished.append(i)
+            remove(i, ran)
+            runnable -= 1
+            if complete is not None:
+                complete(i, curr_time)
+        else:
+            requeue(i, ran)
+            preemptions += 1
+    if stats is not None:
+        stats.update({'sorts': 1, 'loop_iterations': loop_iterations, queue.counter: queue.operations,
+                      'context_switches': context_switches, 'preemptions': preemptions, 'idle_jumps': idle_jumps,
+                      'idle_time': idle_time})
+    _store_results(processes, finished, arrival, burst, completion)
+    return _in_finish_order(processes, finished)
+
+
+class _FairQueue:
+    # Completely fair scheduling: the smallest virtual runtime runs next, and vruntime grows by
+    # run time * NICE_0_WEIGHT / weight. A slice is max(target_latency, runnable * min_granularity)
+    # shared in proportion to weight, rounded up to a whole number of `unit` and at least
+    # min_granularity. New processes start at the current minimum vruntime. The unit divides every
+    # input time, so int and Fraction times stay exact and scaling all times by k scales the
+    # schedule by k.
+    counter = 'heap_operations'
+
+    def __init__(self, weight, target_latency, min_granularity, unit):
+        self.weight = weight
+        self.min_granularity = min_granularity
+        self.unit = unit
+        self.latency_units = int(Fraction(target_latency) / unit)
+        self.granularity_units = int(Fraction(min_granularity) / unit)
+        self.vruntime = [0] * len(weight)
+        self.ready = []  # Heap of (vruntime, seq, k); seq keeps ties in queueing order
+        self.seq = 0
+        self.total_weight = 0  # Weight of every runnable process, the running one included
+        self.min_vruntime = 0
+        self.operations = 0
+
+    def _push(self, k):
+        heapq.heappush(self.ready, (self.vruntime[k], self.seq, k))
+        self.seq += 1
+        self.operations += 1
+
+    def add(self, k):
+        self.vruntime[k] = self.min_vruntime
+        self._push(k)
+        self.total_weight += self.weight[k]
+
+    def pick(self):
+        self.operations += 1
+        return heapq.heappop(self.ready)[2]
+
+    def time_slice(self, k):
+        period = max(self.latency_units, (len(self.ready) + 1) * self.granularity_units)
+        return max(self.min_granularity, -(-period * self.weight[k] // self.total_weight) * self.unit)
+
+    def _charge(self, k, ran):
+        self.vruntime[k] += float(ran / self.unit) * NICE_0_WEIGHT / self.weight[k]
+        ready = self.ready
+        self.min_vruntime = max(self.min_vruntime, min(self.vruntime[k], ready[0][0]) if ready else self.vruntime[k])
+
+    def requeue(self, k, ran):
+        self._charge(k, ran)
+        self._push(k)
+
+    def remove(self, k, ran):
+        self._charge(k, ran)
+        self.total_weight -= self.weight[k]
+
+
+def cfs(processes, target_latency=20, min_granularity=4, timeline=None, stats=None):
+    _, arrival, _, _, remaining, _ = _process_columns(processes)
+    unit = _time_unit([target_latency, min_granularity, *arrival, *remaining])
+    return _run_weighted(processes, lambda weight: _FairQueue(weight, target_latency, min_granularity, unit),
+                         min_granularity, timeline, stats)
+
+
+STRIDE1 = 1 << 20
+
+
+class _StrideQueue:
+    # Stride scheduling: tickets come from the priority weight, stride = STRIDE1 / tickets, and
+    # every quantum goes to the smallest pass; running for t advances pass by stride * t / quantum.
+    # New processes join one stride after the current minimum pass.
+    counter = 'heap_operations'
+
+    def __init__(self, weight, time_quantum):
+        self.stride = [STRIDE1 // tickets for tickets in weight]
+        self.time_quantum = time_quantum
+        self.ready = []  # Heap of (pass, seq, k)
+        self.seq = 0
+        self.global_pass = 0
+        self.current_pass = 0  # Pass of the process picked last
+        self.operations = 0
+
+    def _push(self, pass_value, k):
+        heapq.heappush(self.ready, (pass_value, self.seq, k))
+        self.seq += 1
+        self.operations += 1
+
+    def add(self, k):
+        self._push(self.global_pass + self.stride[k], k)
+
+    def pick(self):
+        self.current_pass, _, k = heapq.heappop(self.ready)
+        self.operations += 1
+        self.global_pass = max(self.global_pass, self.current_pass)
+        return k
+
+    def time_slice(self, k):
+        return self.time_quantum
+
+    def requeue(self, k, ran):
+        self._push(self.current_pass + self.stride[k] * ran // self.time_quantum, k)
+
+    def remove(self, k, ran):
+        pass
+
+
+def stride_scheduling(processes, time_quantum=4, timeline=None, stats=None):
+    return _run_weighted(processes, lambda weight: _StrideQueue(weight, time_quantum), time_quantum, timeline, stats)
+
+
+class _TicketTree:
+    # Fenwick tree over process slots: add/remove tickets and find the winner of a draw in O(log n)
+    def __init__(self, size):
+        self.tree = [0] * (size + 1)
+        self.total = 0
+        self.top = 1 << (size.bit_length() - 1) if size else 0
+
+    def add(self, slot, tickets):
+        self.total += tickets
+        slot += 1
+        while slot < len(self.tree):
+            self.tree[slot] += tickets
+            slot += slot & -slot
+
+    def find(self, ticket):
+        # Slot holding the given ticket number, 0 <= ticket < total
+        position = 0
+        step = self.top
+        while step:
+            if position + step < len(self.tree) and self.tree[position + step] <= ticket:
+                position += step
+                ticket -= self.tree[position]
+            step >>= 1
+        return position
+
+
+class _LotteryQueue:
+    # Lottery scheduling: every quantum draws one of the runnable processes' tickets (the
+    # priority weight) at random, so the CPU share is proportional to tickets on average.
+    # The draw uses random.Random(seed), so a run is reproducible.
+    counter = 'draws'
+
+    def __init__(self, tickets, time_quantum, seed):
+        self.tickets = tickets
+        self.time_quantum = time_quantum
+        self.draw = random.Random(seed).randrange
+        self.tree = _TicketTree(len(tickets))
+        self.slot = [0] * len(tickets)  # Tree slots go out in admission order
+        self.slots = []  # Position holding each slot
+        self.operations = 0
+
+    def add(self, k):
+        self.slot[k] = len(self.slots)
+        self.slots.append(k)
+        self.tree.add(self.slot[k], self.tickets[k])
+
+    def pick(self):
+        self.operations += 1
+        return self.slots[self.tree.find(self.draw(self.tree.total))]
+
+    def time_slice(self, k):
+        return self.time_quantum
+
+    def requeue(self, k, ran):
+        pass  # Its tickets stay in the tree for the next draw
+
+    def remove(self, k, ran):
+        self.tree.add(self.slot[k], -self.tickets[k])
+
+
+def lottery_scheduling(processes, time_quantum=4, seed=0, timeline=None, stats=None):
+    return _run_weighted(processes, lambda tickets: _LotteryQueue(tickets, time_quantum, seed), time_quantum,
+                         timeline, stats)
+
+
+def _priority_with_aging(processes, aging_interval, preemptive, timeline=None, stats=None):
+    # Effective priority = priority - time spent waiting / aging_interval, so a waiting process
+    # gains one level every aging_interval. Ordering the heap on
+    # priority * aging_interval + enqueue time gives the same order at every instant, so
+    # waiting entries never have to be touched as the clock advances.
+    # Preemption happens at the exact crossing, but no earlier than one aging_interval after
+    # dispatch unless the top was already better when it was queued; without that floor,
+    # processes that keep catching up with each other would trade the CPU in ever shorter slices.
+    # Every bound is in aging_interval units, so scaling all times by k scales the schedule by k.
+
+    def crossing():
+        # When the top of the heap takes the CPU from the running process
+        key, i = ready[0]
+        time = dispatched_at + (key - dispatched_level)
+        return time if time < enqueued[i] else max(time, dispatched_at + aging_interval)
+
+    ids, arrival, burst, priority, remaining, completion = _process_columns(processes)
+    arrivals, complete = _arrival_events(processes, arrival)
+    count = len(arrival)
+    base = [(value if value != '' else 0) * aging_interval for value in priority]
+    ready = []  # Heap of (base + enqueue time, i)
+    enqueued = [0] * count
+    starvation = [0] * count  # Longest stretch each process spent waiting
+    finished = []
+    curr_time = 0
+    running = None
+    dispatched_at = dispatched_level = 0  # When the running process took the CPU, and its key then
+    last_process = None
+    loop_iterations = heap_operations = context_switches = preemptions = idle_jumps = idle_time = 0
+    while len(finished) < count:
+        loop_iterations += 1
+        while arrivals.next_time <= curr_time:
+            i = arrivals.pop()
+            enqueued[i] = arrival[i]
+            heapq.heappush(ready, (base[i] + enqueued[i], i))
+            heap_operations += 1
+        preempted = None
+        if running is not None and preemptive and ready and crossing() <= curr_time:
+            # Someone waiting has aged (or arrived) past the running process
+            enqueued[running] = curr_time
+            preempted = (base[running] + curr_time, running)
+            preemptions += 1
+            running = None
+        if running is None:
+            if not ready:
+                idle_jumps += 1
+                idle_time += arrivals.next_time - curr_time
+                curr_time = arrivals.next_time  # Skip the idle gap
+                continue
+            if preempted is None:
+                level, running = heapq.heappop(ready)
+                heap_operations += 1
+            else:
+                # Pop before pushing back, so the top wins even on the exact tie at the crossing
+                level, running = heapq.heapreplace(ready, preempted)
+                heap_operations += 2
+            context_switches += last_process is not None and last_process != running
+            last_process = running
+            dispatched_at, dispatched_level = curr_time, level
+            starvation[running] = max(starvation[running], curr_time - enqueued[running])
+
+        stop = curr_time + remaining[running]
+        if preemptive:
+            stop = min(stop, arrivals.next_time)
+            if ready:
+                stop = min(stop, crossing())
+        if timeline is not None:
+            timeline.add(curr_time, stop, ids[running])
+        remaining[running] = curr_time + remaining[running] - stop
+        curr_time = stop
+        if remaining[running] == 0:
+            completion[running] = curr_time
+            finished.append(running)
+            if complete is not None:
+                complete(running, curr_time)
+            running = None
+
+    if stats is not None:
+        starvation.sort()
+        stats.update(sorts=2, loop_iterations=loop_iterations, heap_operations=heap_operations,
+                     context_switches=context_switches, preemptions=preemptions, idle_jumps=idle_jumps,
+                     idle_time=idle_time, starvation_max=starvation[-1] if starvation else 0,
+                     starvation_p50=percentile(starvation, 50), starvation_p95=percentile(starvation, 95),
+                     starvation_p99=percentile(starvation, 99))
+    _store_results(processes, finished, arrival, burst, completion)
+    if preemptive:
+        return processes  # Input order, as priority_preemptive returns without aging
+    return _in_finish_order(processes, finished)  # Dispatch order, as _run_arrival_aware returns
+
+
+def priority_preemptive(processes, timeline=None, stats=None, aging_interval=None):
+    if aging_interval:
+        return _priority_with_aging(processes, aging_interval, True, timeline, stats)
+    # Processes admitted in arrival order; the ready set is a heap keyed on
+    # (priority, position in the list) so ties go to the earlier process as before.
+    ids, arrival, burst, priority, remaining, completion = _process_columns(processes)
+    arrivals, complete = _arrival_events(processes, arrival)
+    count = len(arrival)
+    finished = []
+    ready = []
+    curr_time = 0
+    loop_iterations = heap_operations = context_switches = preemptions = idle_jumps = idle_time = 0
+    running = None
+    while len(finished) < count:
+        loop_iterations += 1
+        if not ready and arrivals.next_time > curr_time:
+            idle_jumps += 1
+            idle_time += arrivals.next_time - curr_time
+            curr_time = arrivals.next_time  # Skip the idle gap
+        while arrivals.next_time <= curr_time:
+            i = arrivals.pop()
+            if remaining[i] == 0:
+                # Nothing to run: done as soon as it arrives
+                completion[i] = curr_time
+                finished.append(i)
+                if complete is not None:
+                    complete(i, curr_time)
+                continue
+            heapq.heappush(ready, (priority[i], i))
+            heap_operations += 1
+        if not ready:
+            continue
+
+        if ready[0][1] != running:
+            context_switches += running is not None
+            preemptions += running is not None
+            running = ready[0][1]
+        finish_time = curr_time + remaining[running]
+        if arrivals.next_time < finish_time:
+            # Run until the next arrival, then pick again
+            next_time = arrivals.next_time
+            if timeline is not None:
+                timeline.add(curr_time, next_time, ids[running])
+            remaining[running] -= next_time - curr_time
+            curr_time = next_time
+            continue
+
+        heapq.heappop(ready)
+        heap_operations += 1
+        if timeline is not None:
+            timeline.add(curr_time, finish_time, ids[running])
+        remaining[running] = 0
+        curr_time = finish_time
+        completion[running] = curr_time
+        finished.append(running)
+        if complete is not None:
+            complete(running, curr_time)
+        running = None
+        context_switches += 1 if ready or arrivals.next_time != math.inf else 0
+
+    if stats is not None:
+        stats.update(sorts=1, loop_iterations=loop_iterations, heap_operations=heap_operations,
+                     context_switches=context_switches, preemptions=preemptions, idle_jumps=idle_jumps,
+                     idle_time=idle_time)
+    _store_results(processes, finished, arrival, burst, completion)
     return processes
 
-def srtf_preemptive(processes):
-    processes.sort(key=lambda x: x.arrival_time)  # Sort processes by arrival time
+
+def priority_non_preemptive(processes, timeline=None, stats=None, aging_interval=None):
+    if aging_interval:
+        return _priority_with_aging(processes, aging_interval, False, timeline, stats)
+    return _run_arrival_aware(processes, 'priority', timeline, stats)
+
+def srtf_preemptive(processes, timeline=None, stats=None):
+    ids, arrival, burst, _, remaining, completion = _process_columns(processes)
+    arrivals, complete = _arrival_events(processes, arrival)  # Admit processes by arrival time
+    count = len(arrival)
+    pending = []  # Positions in admission order
     current_time = 0
-    remaining_processes = list(processes)
-    completed_processes = []
+    ready = []  # Heap of (remaining_time, admission number) for the arrived processes
+    running = None
+    preemptions = 0
+    loop_iterations = heap_operations = context_switches = idle_jumps = idle_time = 0
+    finished = []
 
-    while remaining_processes:
-        eligible_processes = [p for p in remaining_processes if p.arrival_time <= current_time]
-        if not eligible_processes:
-            current_time += 1
-            continue
+    while len(finished) < count:
+        loop_iterations += 1
+        if not ready and arrivals.next_time > current_time:
+            idle_jumps += 1
+            idle_time += arrivals.next_time - current_time
+            current_time = arrivals.next_time  # Skip the idle gap
+        while arrivals.next_time <= current_time:
+            i = arrivals.pop()
+            heapq.heappush(ready, (remaining[i], len(pending)))
+            pending.append(i)
+            heap_operations += 1
 
-        # Find the process with the shortest remaining burst time
-        shortest_process = min(eligible_processes, key=lambda x: x.remaining_time)
+        # The process with the shortest remaining burst time is on top of the heap
+        remaining_time, k = ready[0]
+        if running is not None and running != k:
+            preemptions += 1
+            context_switches += 1
+        running = k
+        i = pending[k]
 
-        # Execute the process for one time unit
-        shortest_process.remaining_time -= 1
-        current_time += 1
+        # Run it until it completes or the next process arrives
+        finish_time = current_time + remaining_time
+        if arrivals.next_time < finish_time:
+            next_time = arrivals.next_time
+            if timeline is not None:
+                timeline.add(current_time, next_time, ids[i])
+            remaining[i] = finish_time - next_time
+            current_time = next_time
+            heapq.heapreplace(ready, (remaining[i], k))
+            heap_operations += 1
+            continue
+
+        heapq.heappop(ready)
+        heap_operations += 1
+        running = None
+        if timeline is not None:
+            timeline.add(current_time, finish_time, ids[i])
+        current_time = finish_time
+        remaining[i] = 0
+        completion[i] = current_time
+        finished.append(i)
+        if complete is not None:
+            complete(i, current_time)
+        context_switches += 1 if ready or arrivals.next_time != math.inf else 0
 
-        # Check if the process has completed
-        if shortest_process.remaining_time == 0:
-            shortest_process.completion_time = current_time
-            shortest_process.turnaround_time = shortest_process.completion_time - shortest_process.arrival_time
-            shortest_process.waiting_time = shortest_process.turnaround_time - shortest_process.burst_time
-            completed_processes.append(shortest_process)
-            remaining_processes.remove(shortest_process)
+    if stats is not None:
+        stats.update(sorts=1, loop_iterations=loop_iterations, heap_operations=heap_operations,
+                     context_switches=context_switches, preemptions=preemptions, idle_jumps=idle_jumps,
+                     idle_time=idle_time)
+    _store_results(processes, finished, arrival, burst, completion)
+    return _in_finish_order(processes, finished)
 
-    return completed_processes
 
 def average_turnaround_time(processes):
     if not processes:
         return 0
-    return sum(process.turnaround_time for process in processes) / len(processes)
+    if isinstance(processes, ProcessTable):
+        if np is not None:
+            return int(np.frombuffer(processes.turnaround, dtype=np.int64).sum()) / len(processes)
+        return sum(processes.turnaround) / len(processes)
+    return float(sum(process.turnaround_time for process in processes) / len(processes))
 
 
 def average_waiting_time(processes):
     if not processes:
         return 0
-    return sum(process.waiting_time for process in processes) / len(processes)
+    if isinstance(processes, ProcessTable):
+        if np is not None:
+            return int(np.frombuffer(processes.waiting, dtype=np.int64).sum()) / len(processes)
+        return sum(processes.waiting) / len(processes)
+    return float(sum(process.waiting_time for process in processes) / len(processes))
 
 
-def generate_gantt_chart(processes):
-    gantt_chart = " "
-    curr_time = 0
-    for process in processes:
-        gantt_chart += "|"
-        for i in range(process.completion_time - curr_time):
-            gantt_chart += "-"
-        gantt_chart += f"P{process.process_id}"
-        curr_time = process.completion_time
+def generate_gantt_chart(processes, timeline=None):
+    if timeline is None:
+        # Không có timeline: vẽ theo thời gian hoàn thành như trước
+        timeline = Timeline()
+        curr_time = 0
+        for process in processes:
+            timeline.add(curr_time, process.completion_time, process.process_id)
+            curr_time = max(curr_time, process.completion_time)
+    return render_gantt(timeline)
 
-    gantt_chart += "|"
-    return gantt_chart
 
+def parse_process_line(line):
+    # Times may be fractional (2.5, 1/3) or as large as nanosecond timestamps; ids and priorities are int
+    process_data = line.split()
+    if len(process_data) == 4:
+        priority = int(process_data[3])
+    elif len(process_data) == 3:
+        priority = 0  # Không có độ ưu tiên: 0, như trong ProcessTable
+    else:
+        raise ValueError(f"expected 3 or 4 columns, got {len(process_data)}")
+    return int(process_data[0]), parse_time(process_data[1]), parse_time(process_data[2]), priority
 
-def get_processes_from_file(file_path):
-    processes = []
+
+def iter_process_records(file_path, errors=None):
+    # Đọc từng dòng, không nạp cả file vào bộ nhớ; dòng lỗi được ghi vào errors
     with open(file_path, 'r') as file:
-        lines = file.readlines()
-        for line in lines:
-            process_data = line.split()
-            if len(process_data) == 4:
-                if process_data[0] != None:
-                    process_id, arrival_time, burst_time = process_data
-                    process = Process(process_id, int(arrival_time), int(burst_time), int(priority))
-                else:
-                    process_id, arrival_time, burst_time, priority = map(int, process_data)
-                    process = Process(process_id, arrival_time, burst_time, priority)
-            elif len(process_data) == 3:
-                if process_data[0] != None:
-                    process_id, arrival_time, burst_time = process_data
-                    process = Process(process_id, int(arrival_time), int(burst_time), '')
-                else:
-                    process_id, arrival_time, burst_time = map(int, process_data)
-                    process = Process(process_id, arrival_time, burst_time, '')
-            else:
-                print(f"Invalid data in line: {line}")
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
                 continue
-            processes.append(process)
+            try:
+                yield parse_process_line(line)
+            except ValueError:
+                if errors is not None:
+                    errors.append((line_number, line.rstrip('\n')))
+
+
+def iter_processes_from_file(file_path, errors=None):
+    for record in iter_process_records(file_path, errors):
+        yield Process(*record)
+
+
+def iter_process_chunks(file_path, chunk_size=65536, errors=None):
+    chunk = ProcessTable()
+    for record in iter_process_records(file_path, errors):
+        chunk.append(*record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = ProcessTable()
+    if len(chunk):
+        yield chunk
+
+
+def report_invalid_lines(file_path, errors):
+    if errors:
+        line_numbers = ", ".join(str(line_number) for line_number, _ in errors[:10])
+        more = f" and {len(errors) - 10} more" if len(errors) > 10 else ""
+        print(f"Skipped {len(errors)} invalid line(s) in {file_path}: line {line_numbers}{more}")
+
+
+def get_processes_from_file(file_path):
+    errors = []
+    processes = list(iter_processes_from_file(file_path, errors))
+    report_invalid_lines(file_path, errors)
     return processes
 
 
-def write_results_to_file(file_path, avg_waitingTime, avg_turnaroundTime, input_file, algorithm_type):
-    with open(file_path, 'a') as file:
-        file.write(f"Results using {algorithm_type}:\n")
-        file.write(f"Average Waiting Time: {avg_waitingTime}\n")
-        file.write(f"Average Turnaround  Time: {avg_turnaroundTime}\n")
-        file.write(f"Input File: {input_file.upper()}\n")
-        file.write("\n")
+def load_workload(file_path):
+    # File .bin được ánh xạ bộ nhớ (memory-mapped), file văn bản được đọc như trước
+    if file_path.endswith('.bin'):
+        return load_binary_workload(file_path)
+    return get_processes_from_file(file_path)
 
 
-def sort_output_file(file_path):
-    with open(file_path, 'r') as file:
-        lines = file.readlines()
-
-    algorithms = []
-    algorithm_data = {}
-    current_algorithm = None
-
-    for line in lines:
-        if line.startswith("Results using"):
-            if current_algorithm:
-                algorithms.append((current_algorithm, algorithm_data))
-            current_algorithm = line.strip().split(" using ")[1][:-1]
-            algorithm_data = {"avg_waiting_time": None, "avg_turnaround_time": None, "input_file": None}
-        elif line.startswith("Average Waiting Time:"):
-            algorithm_data["avg_waiting_time"] = float(line.strip().split(": ")[1])
-        elif line.startswith("Input File:"):
-            algorithm_data["input_file"] = line.strip().split(": ")[1]
-
-    algorithms.append((current_algorithm, algorithm_data))
-    sorted_algorithms = sorted(algorithms, key=lambda x: x[1]["avg_waiting_time"])
-
-    with open(file_path, 'w') as file:
-        for algorithm, data in sorted_algorithms:
-            file.write(f"--------------------------------------\n")
-            file.write(f"Results using {algorithm}:\n")
-            file.write(f"Average Waiting Time: {data['avg_waiting_time']}\n")
-            file.write(f"Input File: {data['input_file']}\n")
-            file.write("\n")
+def share_workload(processes):
+    # Chép các cột đầu vào vào shared memory một lần để mọi worker cùng đọc
+    table = processes if isinstance(processes, ProcessTable) else ProcessTable.from_processes(processes)
+    count = len(table)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, len(INPUT_COLUMNS) * count * ITEM_SIZE))
+    for position, column in enumerate(INPUT_COLUMNS):
+        start = position * count * ITEM_SIZE
+        shm.buf[start:start + count * ITEM_SIZE] = memoryview(getattr(table, column)).cast('B')
+    return shm, count
 
 
-def compare_algorithms():
+def copy_shared_workload(shm_name, count):
+    # Each run gets its own pristine table, so no algorithm sees another one's results
+    shm = shared_memory.SharedMemory(name=shm_name)
+    table = ProcessTable()
+    try:
+        for position, column in enumerate(INPUT_COLUMNS):
+            start = position * count * ITEM_SIZE
+            getattr(table, column).frombytes(shm.buf[start:start + count * ITEM_SIZE])
+    finally:
+        shm.close()
+    table.reset()
+    return table
+
+
+def _run_isolated(workload, count, algorithm, algorithm_type, stats_enabled=False):
+    # workload: name of the shared memory block, or the (id, arrival, burst, priority) records
+    # of a workload with fractional times
+    instrumentation = Instrumentation(stats_enabled)
+    with instrumentation.phase('load'):
+        if isinstance(workload, str):
+            processes = copy_shared_workload(workload, count)
+        else:
+            processes = [Process(*record) for record in workload]
+    with instrumentation.phase('simulate'):
+        result = algorithm(processes, stats=instrumentation.stats())
+    with instrumentation.phase('metrics'):
+        if fits_table(result):
+            result = ProcessTable.from_processes(result)  # Compact result, cheap to send back
+        avg_waitingTime = average_waiting_time(result)
+        avg_turnaroundTime = average_turnaround_time(result)
+    return algorithm_type, result, avg_waitingTime, avg_turnaroundTime, instrumentation
+
+
+def run_algorithms_isolated(chosen_algorithms, processes, max_workers=None, stats_enabled=False):
+    # Run each (algorithm, algorithm_type) in its own worker; results keep the submission order.
+    # Each result is (algorithm_type, result, avg_waiting, avg_turnaround, instrumentation).
+    shm = None
+    if fits_table(processes):
+        shm, count = share_workload(processes)
+        workload = shm.name
+    else:
+        # Fractional times do not fit the shared int64 columns: every worker gets the records
+        workload = [(p.process_id, p.arrival_time, p.burst_time, p.priority) for p in processes]
+        count = len(workload)
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers or max(1, min(len(chosen_algorithms), os.cpu_count() or 1))) as pool:
+            futures = [pool.submit(_run_isolated, workload, count, algorithm, algorithm_type, stats_enabled)
+                       for algorithm, algorithm_type in chosen_algorithms]
+            return [future.result() for future in futures]
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+
+def algorithm_identity(algorithm):
+    # (name, params) of an algorithm choice, e.g. ('round_robin', {'time_quantum': 4})
+    if isinstance(algorithm, partial):
+        return algorithm.func.__name__, dict(algorithm.keywords)
+    return algorithm.__name__, {}
+
+
+def cache_key(cache, file_name, algorithm):
+    name, params = algorithm_identity(algorithm)
+    return cache.key(file_name, name, params)
+
+
+def cached_result(cache, key, algorithm_type):
+    # Same shape as a run_algorithms_isolated result, or None on a miss
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    result, _, avg_waitingTime, avg_turnaroundTime = entry
+    return algorithm_type, result, avg_waitingTime, avg_turnaroundTime, Instrumentation()
+
+
+def record_results(kind, file_name, entries):
+    # entries: (algorithm, algorithm_type, process_count, avg_waiting, avg_turnaround), stored as one run
+    with ResultStore() as store:
+        run_id = store.start_run(kind)
+        for algorithm, algorithm_type, process_count, avg_waitingTime, avg_turnaroundTime in entries:
+            name, params = algorithm_identity(algorithm)
+            store.add_result(run_id, name, algorithm_type, params, file_name, process_count,
+                             avg_waitingTime, avg_turnaroundTime)
+
+
+def compare_algorithms(stats_enabled=False):
     print("Compare Algorithms")
     num_algorithms = int(input("Enter the number of algorithms to compare: "))
 
@@ -237,15 +1218,24 @@ def compare_algorithms():
         chosen_algorithms.append((scheduling_algorithm, algorithm_type))
 
     file_name = choose_input_file()
-    list_processes = get_processes_from_file(file_name)
+    comparison = Instrumentation(stats_enabled)
+    cache = ResultCache()
+    keys = [cache_key(cache, file_name, algorithm) for algorithm, _ in chosen_algorithms]
+    results = [cached_result(cache, key, algorithm_type) for key, (_, algorithm_type) in zip(keys, chosen_algorithms)]
+    missing = [i for i, result in enumerate(results) if result is None]
+    comparison.counters['cache_hits'] = len(results) - len(missing)
     output_file_name = input("Enter the output file name (Example: compare_results.txt): ")
-    results = []
-    for algorithm, algorithm_type in chosen_algorithms:
-        result = algorithm(list_processes)
-        avg_turnaroundTime = average_turnaround_time(result)
-        avg_waitingTime = average_waiting_time(result)
-        results.append((algorithm_type, result, avg_waitingTime, avg_turnaroundTime))
-
+    if missing:
+        # Chỉ chạy những thuật toán chưa có trong cache
+        with comparison.phase('load'):
+            list_processes = load_workload(file_name)
+        with comparison.phase('simulate'):
+            fresh = run_algorithms_isolated([chosen_algorithms[i] for i in missing], list_processes,
+                                            stats_enabled=stats_enabled)
+        for i, (algorithm_type, result, avg_waitingTime, avg_turnaroundTime, instrumentation) in zip(missing, fresh):
+            cache.put(keys[i], (result, None, avg_waitingTime, avg_turnaroundTime))
+            results[i] = (algorithm_type, result, avg_waitingTime, avg_turnaroundTime, instrumentation)
+    for algorithm_type, result, avg_waitingTime, avg_turnaroundTime, instrumentation in results:
         print(f"\nResult Table {algorithm_type}:")
         print(f"ProcessID\tArrivalTime\tBurstTime\tPriority\tCompletionTime\tTurnaroundTime\tWaitingTime")
         for process in result:
@@ -255,10 +1245,11 @@ def compare_algorithms():
             else:
                 print(
                     f"{process.process_id}\t\t\t{process.arrival_time}\t\t\t{process.burst_time}\t\t\tNo Priority\t\t\t{process.completion_time}\t\t\t\t{process.turnaround_time}\t\t\t\t{process.waiting_time}")
-    with open(output_file_name, 'a') as file:
+        instrumentation.dump(algorithm_type)
+    with comparison.phase('output'), open(output_file_name, 'a') as file:
         file.write(f"-------------------- {file_name.upper()}--------------------\n")
         file.write(f"Comparing {num_algorithms} algorithms for {file_name}:\n")
-        for algorithm_type, _, avg_waitingTime, avg_turnaroundTime in results:
+        for algorithm_type, _, avg_waitingTime, avg_turnaroundTime, _ in results:
             print(f"------------------------------------\n")
             file.write(f"Algorithm: {algorithm_type}\n")
             print(f"Algorithm: {algorithm_type}\n")
@@ -267,6 +1258,11 @@ def compare_algorithms():
             file.write(f"Average Turnaround Time: {avg_turnaroundTime}\n")
             print(f"Average Turnaround Time: {avg_turnaroundTime}\n")
             file.write("\n")
+        entries = []
+        for (algorithm, _), (algorithm_type, result, avg_waitingTime, avg_turnaroundTime, _) in zip(chosen_algorithms, results):
+            entries.append((algorithm, algorithm_type, len(result), avg_waitingTime, avg_turnaroundTime))
+        record_results('compare', file_name, entries)
+    comparison.dump(f"comparison of {file_name}")
 
 
 # def compare_algorithms():
@@ -363,7 +1359,6 @@ def get_input_files_from_directory(directory_path):
 
 # Sử dụng hàm get_input_files_from_directory để lấy danh sách các file input từ một thư mục cụ thể
 directory_path = "C:/Users/ADMIN/PycharmProjects/pythonCPU"
-input_files = get_input_files_from_directory(directory_path)
 
 def read_file(file_name):
     try:
@@ -372,36 +1367,41 @@ def read_file(file_name):
             print(content)
     except FileNotFoundError:
         print(f"Error: File '{file_name}' not found.")
+def find_input_files(directory=""):
+    # input1.txt, input2.txt, ..., input10.txt theo thứ tự số
+    names = glob.glob(os.path.join(directory, "input*.txt")) + glob.glob(os.path.join(directory, "input*.bin"))
+    return sorted(names, key=lambda name: (len(name), name))
+
+
 def choose_input_file():
+    input_files = find_input_files()
     print("Choose an input file:")
-    print("1. input1.txt")
-    print("2. input2.txt")
-    print("3. input3.txt")
-    print("4. input4.txt")
-    print("5. input5.txt")
-    print("6. input6.txt")
-    print("7. input7.txt")
+    for i, file_name in enumerate(input_files):
+        print(f"{i + 1}. {os.path.basename(file_name)}")
     choice = input("Enter your choice: ")
 
-    if choice == '1':
-        return "input1.txt"
-    elif choice == '2':
-        return "input2.txt"
-    elif choice == '3':
-        return "input3.txt"
-    elif choice == '4':
-        return "input4.txt"
-    elif choice == '5':
-        return "input5.txt"
-    elif choice == '6':
-        return "input6.txt"
-    elif choice == '7':
-        return "input7.txt"
+    if choice.isdigit() and 1 <= int(choice) <= len(input_files):
+        return input_files[int(choice) - 1]
     else:
         print("Invalid choice. Using default file input1.txt.")
         return "input1.txt"
 
 
+ALGORITHMS = {
+    'fcfs': (fcfs, "FCFS (First Come First Serve)"),
+    'sjf': (sjf_non_preemptive, "SJF (Shortest Job First)"),
+    'rr': (round_robin, "RR (Round Robin)"),
+    'srtf': (srtf_preemptive, "SRTF Preemptive (Shortest Remaining Time First)"),
+    'priority_preemptive': (priority_preemptive, "Priority Preemptive"),
+    'priority_non_preemptive': (priority_non_preemptive, "Priority Non_Preemptive"),
+    'mlfq': (mlfq, "MLFQ (Multilevel Feedback Queue)"),
+    'cfs': (cfs, "CFS (Completely Fair Scheduler)"),
+    'stride': (stride_scheduling, "Stride Scheduling"),
+    'lottery': (lottery_scheduling, "Lottery Scheduling"),
+    'multicore': (simulate_multicore, "Multi-core"),
+}
+
+
 def choose_algorithm():
     print("Choose a scheduling algorithm:")
     print("1. FCFS (First Come First Serve)")
@@ -410,7 +1410,11 @@ def choose_algorithm():
     print("4. SRTF Preemptive (Shortest Remaining Time First)")
     print("5. Priority Preemptive")
     print("6. Priority Non_Preemptive")
-    print("7. Quit")
+    print("7. MLFQ (Multilevel Feedback Queue)")
+    print("8. CFS (Completely Fair Scheduler)")
+    print("9. Stride Scheduling")
+    print("10. Lottery Scheduling")
+    print("11. Quit")
     choice = input("Enter your choice: ")
 
     if choice == '1':
@@ -418,22 +1422,44 @@ def choose_algorithm():
     elif choice == '2':
         return sjf_non_preemptive, "SJF (Shortest Job First)"
     elif choice == '3':
-        time_quantum = int(input("Enter time quantum for Round Robin('example:4'): "))
-        return lambda processes: round_robin(processes,
-                                             time_quantum), f"RR (Round Robin) with Time Quantum {time_quantum}"
+        time_quantum = parse_time(input("Enter time quantum for Round Robin('example:4'): "))
+        return partial(round_robin, time_quantum=time_quantum), f"RR (Round Robin) with Time Quantum {time_quantum}"
     elif choice == '4':
         return srtf_preemptive, "SRTF Preemptive (Shortest Remaining Time First)"
-    elif choice == '5':
-        return priority_preemptive, "Priority Preemptive"
-    elif choice == '6':
-        return priority_non_preemptive, "Priority Non_Preemptive"
+    elif choice in ('5', '6'):
+        scheduling_algorithm, algorithm_type = ((priority_preemptive, "Priority Preemptive") if choice == '5' else
+                                                (priority_non_preemptive, "Priority Non_Preemptive"))
+        aging_interval = parse_time(input("Enter the aging interval, 0 for no aging ('example:50'): ") or '0')
+        if aging_interval:
+            return (partial(scheduling_algorithm, aging_interval=aging_interval),
+                    f"{algorithm_type} with Aging Interval {aging_interval}")
+        return scheduling_algorithm, algorithm_type
     elif choice == '7':
+        quanta = tuple(parse_time(value) for value in input("Enter the time quantum of each level ('example:4 8 16'): ").split())
+        boost_interval = parse_time(input("Enter the priority boost interval, 0 for none ('example:100'): "))
+        return (partial(mlfq, quanta=quanta, boost_interval=boost_interval or None),
+                f"MLFQ (Multilevel Feedback Queue) with Quanta {' '.join(map(str, quanta))} and Boost {boost_interval}")
+    elif choice == '8':
+        target_latency, min_granularity = (parse_time(value) for value in input(
+            "Enter target latency and minimum granularity ('example:20 4'): ").split())
+        return (partial(cfs, target_latency=target_latency, min_granularity=min_granularity),
+                f"CFS (Completely Fair Scheduler) with Target Latency {target_latency} and Granularity {min_granularity}")
+    elif choice == '9':
+        time_quantum = parse_time(input("Enter time quantum for Stride Scheduling('example:4'): "))
+        return (partial(stride_scheduling, time_quantum=time_quantum),
+                f"Stride Scheduling with Time Quantum {time_quantum}")
+    elif choice == '10':
+        time_quantum = parse_time(input("Enter time quantum for Lottery Scheduling('example:4'): "))
+        seed = int(input("Enter the random seed ('example:0'): ") or 0)
+        return (partial(lottery_scheduling, time_quantum=time_quantum, seed=seed),
+                f"Lottery Scheduling with Time Quantum {time_quantum} and Seed {seed}")
+    elif choice == '11':
         return None, None
     else:
         print("Invalid choice. Using default Priority Preemptive.")
         return fcfs, "FCFS (First Come First Serve)"
 
-def main():
+def main(stats_enabled=False):
     while True:
         print("\nCPU SCHEDULING ALGORITHM:")
         print("1. Run a Single Algorithm")
@@ -446,36 +1472,54 @@ def main():
             scheduling_algorithm, algorithm_type = choose_algorithm()
             if scheduling_algorithm is not None:
                 file_name = choose_input_file()
-                list_processes = get_processes_from_file(file_name)
-                result = scheduling_algorithm(list_processes)
-                avg_turnaroundTime = average_turnaround_time(list_processes)
-                avg_waitingTime = average_waiting_time(list_processes)
-                print(f"\nResult Table {algorithm_type}:")
-                print(f"ProcessID\tArrivalTime\tBurstTime\tPriority\tCompletionTime\tTurnaroundTime\tWaitingTime")
-                for process in result:
-                    if hasattr(process, 'priority'):
-                        print(
-                            f"{process.process_id}\t\t\t{process.arrival_time}\t\t\t{process.burst_time}\t\t\t{process.priority}\t\t\t{process.completion_time}\t\t\t\t{process.turnaround_time}\t\t\t\t{process.waiting_time}")
-                    else:
-                        print(
-                            f"{process.process_id}\t\t\t{process.arrival_time}\t\t\t{process.burst_time}\t\t\tNo Priority\t\t\t{process.completion_time}\t\t\t\t{process.turnaround_time}\t\t\t\t{process.waiting_time}")
-                print(f"\nAverage Waiting Time: {avg_waitingTime}")
-                print(f"Average Turnaround Time: {avg_turnaroundTime}")
-                print("\nGantt Chart: \n")
-                gantt_chart = generate_gantt_chart(result)
-                print(gantt_chart)
-                print(
-                    "\n--------------------------------------------------------------------------------------------------\n")
-                output_file = "output.txt"
-                write_results_to_file(output_file, avg_waitingTime, avg_turnaroundTime, file_name, algorithm_type)
-                sort_output_file(output_file)
+                instrumentation = Instrumentation(stats_enabled)
+                cache = ResultCache()
+                key = cache_key(cache, file_name, scheduling_algorithm)
+                cached = cache.get(key)
+                if cached is not None and cached[1] is None:
+                    cached = None  # Stored by a comparison, which keeps no timeline for the Gantt chart
+                if cached is not None:
+                    # Cùng workload, cùng thuật toán và tham số: dùng lại kết quả đã lưu
+                    result, timeline, avg_waitingTime, avg_turnaroundTime = cached
+                    instrumentation.counters['cache_hits'] = 1
+                else:
+                    with instrumentation.phase('load'):
+                        list_processes = load_workload(file_name)
+                    timeline = Timeline()
+                    with instrumentation.phase('simulate'):
+                        result = scheduling_algorithm(list_processes, timeline=timeline, stats=instrumentation.stats())
+                    with instrumentation.phase('metrics'):
+                        avg_turnaroundTime = average_turnaround_time(list_processes)
+                        avg_waitingTime = average_waiting_time(list_processes)
+                    cache.put(key, (ProcessTable.from_processes(result) if fits_table(result) else result, timeline,
+                                    avg_waitingTime, avg_turnaroundTime))
+                with instrumentation.phase('output'):
+                    print(f"\nResult Table {algorithm_type}:")
+                    print(f"ProcessID\tArrivalTime\tBurstTime\tPriority\tCompletionTime\tTurnaroundTime\tWaitingTime")
+                    for process in result:
+                        if hasattr(process, 'priority'):
+                            print(
+                                f"{process.process_id}\t\t\t{process.arrival_time}\t\t\t{process.burst_time}\t\t\t{process.priority}\t\t\t{process.completion_time}\t\t\t\t{process.turnaround_time}\t\t\t\t{process.waiting_time}")
+                        else:
+                            print(
+                                f"{process.process_id}\t\t\t{process.arrival_time}\t\t\t{process.burst_time}\t\t\tNo Priority\t\t\t{process.completion_time}\t\t\t\t{process.turnaround_time}\t\t\t\t{process.waiting_time}")
+                    print(f"\nAverage Waiting Time: {avg_waitingTime}")
+                    print(f"Average Turnaround Time: {avg_turnaroundTime}")
+                    print("\nGantt Chart: \n")
+                    gantt_chart = generate_gantt_chart(result, timeline)
+                    print(gantt_chart)
+                    print(
+                        "\n--------------------------------------------------------------------------------------------------\n")
+                    record_results('single', file_name, [(scheduling_algorithm, algorithm_type, len(result),
+                                                          avg_waitingTime, avg_turnaroundTime)])
+                instrumentation.dump(algorithm_type)
 
         elif choice == '2':
-            compare_algorithms()
+            compare_algorithms(stats_enabled)
         elif choice == '3':
             # break
             print("All Files in the Directory:")
-            for file_path in input_files:
+            for file_path in get_input_files_from_directory(directory_path):
                 print(file_path)
             print("-------------------")
             file_name = input("Open Files name : ")
@@ -488,4 +1532,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(stats_enabled='--stats' in sys.argv[1:])
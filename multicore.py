@@ -0,0 +1,339 @@
+import argparse
+import heapq
+import math
+
+from online import POLICIES, PREEMPTIVE_POLICIES
+from process_table import ProcessTable, parse_time
+
+PLACEMENTS = ('global', 'per_core')
+PAD = (math.inf,)  # Not running: never the process to preempt
+
+
+class _CoreTree:
+    # Tournament tree over the cores: the core with the smallest value (ties to the lowest
+    # core id) is at the root, and changing one core's value costs O(log cores)
+    def __init__(self, cores, value, pad=math.inf):
+        self.size = 1 << max(0, (cores - 1).bit_length())
+        self.tree = [None] * self.size + [(value if core < cores else pad, core) for core in range(self.size)]
+        for k in range(self.size - 1, 0, -1):
+            self.tree[k] = min(self.tree[2 * k], self.tree[2 * k + 1])
+
+    def update(self, core, value):
+        tree = self.tree
+        k = self.size + core
+        if tree[k][0] == value:
+            return
+        tree[k] = (value, core)
+        k >>= 1
+        while k:
+            left, right = tree[2 * k], tree[2 * k + 1]
+            winner = left if left <= right else right
+            if tree[k] == winner:
+                return  # Nothing above this node changes
+            tree[k] = winner
+            k >>= 1
+
+    def min(self):
+        return self.tree[1]
+
+
+class _MultiCoreRun:
+    # Event-driven simulation of `cores` identical CPUs. Time only moves to the next arrival
+    # or slice end, and every event touches one ready heap and O(1) core trees, so a run costs
+    # O(events * (log n + log cores)). With one core the schedules match the functions in main.py.
+
+    def __init__(self, processes, policy, cores, placement, time_quantum, migration_cost):
+        if isinstance(processes, ProcessTable):
+            self.arrival = processes.arrival.tolist()
+            self.burst = processes.burst.tolist()
+            self.priority = processes.priority.tolist()
+        else:
+            self.arrival = [process.arrival_time for process in processes]
+            self.burst = [process.burst_time for process in processes]
+            self.priority = [process.priority if process.priority != '' else 0 for process in processes]
+        count = len(self.arrival)
+        self.order = sorted(range(count), key=self.arrival.__getitem__)
+        self.rank = [0] * count  # Position in arrival order, the tie-breaker of most policies
+        for position, i in enumerate(self.order):
+            self.rank[i] = position
+        self.remaining = list(self.burst)
+        self.completion = [0] * count
+        self.last_core = [-1] * count
+
+        self.policy = policy
+        self.cores = cores
+        self.per_core = placement == 'per_core'
+        self.time_quantum = time_quantum
+        self.migration_cost = migration_cost
+        queues = cores if self.per_core else 1
+        self.ready = [[] for _ in range(queues)]  # Heaps of (key, process index)
+        self.staged = [[] for _ in range(queues)]  # Round robin arrivals waiting for the next dispatch point
+        self.seq = 0
+
+        self.running = [-1] * cores
+        self.start = [0] * cores
+        self.end = [0] * cores
+        self.generation = [0] * cores
+        self.merged = set()  # Round robin cores running merged quanta of a lone process
+        self.events = []  # Heap of (slice end, core, generation)
+        self.idle = _CoreTree(cores, 0)  # 0 while the core is idle
+        self.worst_running = _CoreTree(cores, PAD, PAD)  # Global preemption: the running process to preempt first
+        self.load = _CoreTree(cores, 0)  # Per-core placement: queued + running processes
+        self.queued = _CoreTree(cores, 0)  # Per-core stealing: minus the number of queued processes
+        self.track_running = policy in PREEMPTIVE_POLICIES and not self.per_core
+
+        self.completed = 0
+        self.busy_time = 0
+        self.dispatches = self.preemptions = self.migrations = self.steals = 0
+
+    def _key(self, i):
+        if self.policy == 'fcfs':
+            return self.arrival[i], self.rank[i]
+        if self.policy == 'sjf':
+            return self.burst[i], self.arrival[i], self.rank[i]
+        if self.policy == 'priority_non_preemptive':
+            return self.priority[i], self.arrival[i], self.rank[i]
+        if self.policy == 'srtf':
+            return self.remaining[i], self.rank[i]
+        if self.policy == 'priority_preemptive':
+            return self.priority[i], i
+        self.seq += 1
+        return (self.seq,)
+
+    def _running_key(self, core, now):
+        i = self.running[core]
+        if self.policy == 'srtf':
+            return self.end[core] - now, self.rank[i]
+        return self.priority[i], i
+
+    def _queue_of(self, core):
+        return core if self.per_core else 0
+
+    def _queue_changed(self, q):
+        if self.per_core:
+            waiting = len(self.ready[q]) + len(self.staged[q])
+            self.load.update(q, waiting + (self.running[q] != -1))
+            self.queued.update(q, -waiting)
+
+    def _idle_core(self):
+        value, core = self.idle.min()
+        return core if value == 0 else None
+
+    def _enqueue(self, q, i):
+        heapq.heappush(self.ready[q], (self._key(i), i))
+
+    def _flush(self, q):
+        # Round robin: arrivals join the queue behind the processes re-queued at this dispatch point
+        for i in self.staged[q]:
+            self._enqueue(q, i)
+        self.staged[q].clear()
+
+    def _admit(self, i):
+        q = self.load.min()[1] if self.per_core else 0
+        if self.policy == 'rr':
+            self.staged[q].append(i)
+        else:
+            self._enqueue(q, i)
+        self._queue_changed(q)
+        return q
+
+    def _dispatch(self, core, now):
+        q = self._queue_of(core)
+        self._flush(q)
+        if not self.ready[q] and self.per_core:
+            waiting, victim = self.queued.min()
+            if waiting == 0:
+                return False
+            self._flush(victim)
+            i = heapq.heappop(self.ready[victim])[1]
+            self.steals += 1
+            self._queue_changed(victim)
+        elif not self.ready[q]:
+            return False
+        else:
+            i = heapq.heappop(self.ready[q])[1]
+
+        if self.last_core[i] not in (-1, core):
+            self.migrations += 1
+            self.remaining[i] += self.migration_cost
+        self.last_core[i] = core
+        self.running[core] = i
+        self.start[core] = now
+        self.generation[core] += 1
+        self.dispatches += 1
+        end = now + self.remaining[i]
+        if self.policy == 'rr' and self.remaining[i] > self.time_quantum:
+            if self.ready[q] or self.staged[q]:
+                end = now + self.time_quantum
+            else:
+                self.merged.add(core)  # Lone process: merged quanta, cut back when someone queues up
+        self.end[core] = end
+        heapq.heappush(self.events, (end, core, self.generation[core]))
+        self.idle.update(core, 1)
+        if self.track_running:
+            # SRTF: running processes all lose remaining time at the same rate, so their
+            # order is fixed by (end, rank) from dispatch on
+            if self.policy == 'srtf':
+                self.worst_running.update(core, (-end, -self.rank[i]))
+            else:
+                self.worst_running.update(core, (-self.priority[i], -i))
+        self._queue_changed(q)
+        return True
+
+    def _end_slice(self, core, now):
+        i = self.running[core]
+        # Same sum as the slice's end at dispatch, so a finished process is left with exactly 0
+        self.remaining[i] = self.start[core] + self.remaining[i] - now
+        self.busy_time += now - self.start[core]
+        self.running[core] = -1
+        self.generation[core] += 1  # Any pending event of this slice is now stale
+        self.merged.discard(core)
+        self.idle.update(core, 0)
+        if self.track_running:
+            self.worst_running.update(core, PAD)
+        q = self._queue_of(core)
+        if self.remaining[i] == 0:
+            self.completion[i] = now
+            self.completed += 1
+        else:
+            self._enqueue(q, i)  # Preempted or end of quantum: back to this core's queue
+        self._queue_changed(q)
+
+    def _preempt(self, core, now):
+        self._end_slice(core, now)
+        self.preemptions += 1
+        self._dispatch(core, now)
+
+    def _preempt_if_needed(self, now, queues):
+        if not self.per_core:
+            while self.ready[0] and self._idle_core() is None:
+                value, core = self.worst_running.min()
+                if value == PAD or not self.ready[0][0][0] < self._running_key(core, now):
+                    break
+                self._preempt(core, now)
+            return
+        for core in queues:
+            if self.running[core] != -1 and self.ready[core] and self.ready[core][0][0] < self._running_key(core, now):
+                self._preempt(core, now)
+
+    def _cut_merged_slices(self, now, queues):
+        # Someone is waiting: merged quanta end at the first quantum boundary from now on
+        if self.per_core:
+            cores = [core for core in queues if core in self.merged and (self.ready[core] or self.staged[core])]
+        else:
+            cores = list(self.merged) if self.ready[0] or self.staged[0] else []
+        ended = []
+        for core in cores:
+            self.merged.discard(core)
+            quanta = max(1, -(-(now - self.start[core]) // self.time_quantum))
+            end = self.start[core] + quanta * self.time_quantum
+            if end >= self.end[core]:
+                continue
+            if end == now:
+                self._end_slice(core, now)
+                ended.append(core)
+                continue
+            self.end[core] = end
+            self.generation[core] += 1
+            heapq.heappush(self.events, (end, core, self.generation[core]))
+        return ended
+
+    def _settle(self, now, candidates, queues):
+        while True:
+            if self.per_core:
+                for core in candidates:
+                    if self.running[core] == -1:
+                        self._dispatch(core, now)
+            # Idle cores take whatever is queued (per-core: steal from the longest queue)
+            core = self._idle_core()
+            while core is not None and self._dispatch(core, now):
+                core = self._idle_core()
+            if self.policy in PREEMPTIVE_POLICIES:
+                self._preempt_if_needed(now, queues)
+            if self.policy != 'rr':
+                return
+            candidates = self._cut_merged_slices(now, queues)
+            if not candidates:
+                return
+
+    def run(self):
+        count = len(self.order)
+        next_arrival = 0
+        now = 0
+        while self.completed < count:
+            now = min(self.events[0][0] if self.events else math.inf,
+                      self.arrival[self.order[next_arrival]] if next_arrival < count else math.inf)
+            freed = []
+            while self.events and self.events[0][0] == now:
+                _, core, generation = heapq.heappop(self.events)
+                if generation == self.generation[core]:
+                    self._end_slice(core, now)
+                    freed.append(core)
+            queues = set()
+            while next_arrival < count and self.arrival[self.order[next_arrival]] <= now:
+                queues.add(self._admit(self.order[next_arrival]))
+                next_arrival += 1
+            self._settle(now, freed + sorted(queues) if self.per_core else freed, queues)
+        return now
+
+
+def simulate_multicore(processes, policy='fcfs', cores=1, placement='global', time_quantum=None,
+                       migration_cost=0, stats=None):
+    # Run `policy` on `cores` CPUs. placement='global' shares one ready queue; 'per_core' puts
+    # each arrival on the least loaded core and lets idle cores steal from the longest queue.
+    # A process resuming on another core counts as a migration and pays migration_cost.
+    if policy not in POLICIES:
+        raise ValueError(f"unknown policy {policy!r}, expected one of {', '.join(POLICIES)}")
+    if placement not in PLACEMENTS:
+        raise ValueError(f"unknown placement {placement!r}, expected one of {', '.join(PLACEMENTS)}")
+    if cores < 1:
+        raise ValueError("cores must be at least 1")
+    if policy == 'rr' and not time_quantum:
+        raise ValueError("round robin needs a positive time_quantum")
+
+    run = _MultiCoreRun(processes, policy, cores, placement, time_quantum, migration_cost)
+    makespan = run.run()
+    completion = run.completion
+    if isinstance(processes, ProcessTable):
+        for i, completion_time in enumerate(completion):
+            processes.remaining[i] = 0
+            processes.completion[i] = completion_time
+            processes.turnaround[i] = completion_time - run.arrival[i]
+            processes.waiting[i] = completion_time - run.arrival[i] - run.burst[i]
+    else:
+        for process, completion_time in zip(processes, completion):
+            process.remaining_time = 0
+            process.completion_time = completion_time
+            process.turnaround_time = completion_time - process.arrival_time
+            process.waiting_time = process.turnaround_time - process.burst_time
+    if stats is not None:
+        stats.update(cores=cores, dispatches=run.dispatches, preemptions=run.preemptions,
+                     migrations=run.migrations, steals=run.steals, busy_time=run.busy_time, makespan=makespan,
+                     utilization=float(run.busy_time / (cores * makespan)) if makespan else 0.0)
+    return processes
+
+
+def main():
+    from main import average_turnaround_time, average_waiting_time, load_workload
+
+    parser = argparse.ArgumentParser(description="Simulate a scheduling policy on several CPU cores.")
+    parser.add_argument('input_file')
+    parser.add_argument('--policy', default='fcfs', choices=POLICIES)
+    parser.add_argument('--cores', type=int, default=4)
+    parser.add_argument('--placement', default='global', choices=PLACEMENTS)
+    parser.add_argument('--quantum', type=parse_time, help="time quantum for rr")
+    parser.add_argument('--migration-cost', type=parse_time, default=0,
+                        help="extra run time when a process changes core")
+    args = parser.parse_args()
+
+    stats = {}
+    processes = load_workload(args.input_file)
+    simulate_multicore(processes, args.policy, args.cores, args.placement, args.quantum, args.migration_cost, stats)
+    print(f"Average Waiting Time: {average_waiting_time(processes)}")
+    print(f"Average Turnaround Time: {average_turnaround_time(processes)}")
+    for name, value in stats.items():
+        print(f"{name}: {value}")
+
+
+if __name__ == "__main__":
+    main()
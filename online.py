@@ -0,0 +1,156 @@
+import heapq
+import math
+from collections import deque
+
+POLICIES = ('fcfs', 'sjf', 'rr', 'srtf', 'priority_preemptive', 'priority_non_preemptive')
+PREEMPTIVE_POLICIES = ('srtf', 'priority_preemptive')
+
+
+class OnlineScheduler:
+    # Step-wise scheduler for a live feed: submit() processes as they are announced, advance()
+    # the clock and collect the processes that completed. Only submitted-but-unfinished
+    # processes are kept, so memory follows the live ready set rather than the whole history.
+    # Tie-breaking follows the batch functions in main.py, with submission order standing in
+    # for list position.
+
+    def __init__(self, policy, time_quantum=None):
+        if policy not in POLICIES:
+            raise ValueError(f"unknown policy {policy!r}, expected one of {', '.join(POLICIES)}")
+        if policy == 'rr' and not time_quantum:
+            raise ValueError("round robin needs a positive time_quantum")
+        self.policy = policy
+        self.time_quantum = time_quantum
+        self.now = 0
+        self.pending = []  # Heap of (arrival_time, seq, process) not yet arrived
+        self.ready = deque() if policy == 'rr' else []
+        self.running = None
+        self.running_seq = None
+        self.slice_start = 0
+        self.slice_end = 0
+        self.finish_time = 0  # When the running process would complete if left alone
+        self.preemptions = 0
+        self._seq = 0
+
+    def __len__(self):
+        return len(self.pending) + len(self.ready) + (self.running is not None)
+
+    def submit(self, process):
+        if process.arrival_time < self.now:
+            raise ValueError(f"process {process.process_id} arrives at {process.arrival_time}, "
+                             f"but the clock is already at {self.now}")
+        heapq.heappush(self.pending, (process.arrival_time, self._seq, process))
+        self._seq += 1
+
+    def _key(self, process, seq):
+        if self.policy == 'fcfs':
+            return process.arrival_time, seq
+        if self.policy == 'sjf':
+            return process.burst_time, process.arrival_time, seq
+        if self.policy == 'srtf':
+            return process.remaining_time, seq
+        if self.policy == 'priority_preemptive':
+            # Equal priorities: the earlier submission wins, not the earlier arrival. It matches
+            # priority_preemptive in main.py, whose ties go by list position, when the list is
+            # submitted in order
+            return process.priority, seq
+        return process.priority, process.arrival_time, seq
+
+    def _admit(self, up_to):
+        while self.pending and self.pending[0][0] <= up_to:
+            _, seq, process = heapq.heappop(self.pending)
+            if self.policy == 'rr':
+                self.ready.append((seq, process))
+            else:
+                heapq.heappush(self.ready, (self._key(process, seq), seq, process))
+
+    def _dispatch(self):
+        if self.policy == 'rr':
+            self.running_seq, self.running = self.ready.popleft()
+            self.slice_start = self.now
+            self.finish_time = self.now + self.running.remaining_time
+            if self.ready:
+                self.slice_end = min(self.finish_time, self.now + self.time_quantum)
+            else:
+                # Lone process: merged quanta, cut back when someone arrives
+                self.slice_end = self.finish_time
+        else:
+            _, self.running_seq, self.running = heapq.heappop(self.ready)
+            self.finish_time = self.slice_end = self.now + self.running.remaining_time
+
+    def _cut_merged_slice(self, arrival_time):
+        # Someone arrives during merged quanta: end the slice at the first quantum boundary after it
+        quanta = max(1, -(-(arrival_time - self.slice_start) // self.time_quantum))
+        self.slice_end = min(self.slice_end, self.slice_start + quanta * self.time_quantum)
+
+    def _preempt_if_needed(self):
+        self._admit(self.now)
+        if self.ready and self.ready[0][0] < self._key(self.running, self.running_seq):
+            heapq.heappush(self.ready, (self._key(self.running, self.running_seq), self.running_seq, self.running))
+            self.preemptions += 1
+            self._dispatch()
+
+    def _complete(self, process):
+        process.remaining_time = 0
+        process.completion_time = self.now
+        process.turnaround_time = process.completion_time - process.arrival_time
+        process.waiting_time = process.turnaround_time - process.burst_time
+        self.running = None
+
+    def advance(self, until):
+        # Run up to time `until` and return the processes completed on the way, in order
+        completed = []
+        while True:
+            if self.now >= until:
+                # Decisions at `until` wait for the next call: more processes may arrive at that time
+                return completed
+            if self.running is None:
+                self._admit(self.now)
+                if not self.ready:
+                    if not self.pending or self.pending[0][0] > until:
+                        if until != math.inf:
+                            self.now = max(self.now, until)
+                        return completed
+                    self.now = self.pending[0][0]  # Skip the idle gap
+                    continue
+                self._dispatch()
+            elif self.policy in PREEMPTIVE_POLICIES:
+                self._preempt_if_needed()
+            elif self.policy == 'rr':
+                # Submitted after the slice started but arrived by then: queue ahead of the running process
+                self._admit(self.slice_start)
+                if self.ready:
+                    self._cut_merged_slice(self.slice_start)
+
+            stop = self.slice_end
+            if self.pending and self.pending[0][0] < stop:
+                if self.policy in PREEMPTIVE_POLICIES:
+                    stop = self.pending[0][0]
+                elif self.policy == 'rr':
+                    self._cut_merged_slice(self.pending[0][0])
+                    stop = self.slice_end
+            if stop > until:
+                self.running.remaining_time = self.finish_time - until
+                self.now = until
+                return completed
+
+            self.running.remaining_time = self.finish_time - stop  # Exactly 0 at the finish, even for floats
+            self.now = stop
+            if self.running.remaining_time <= 0:
+                completed.append(self.running)
+                self._complete(self.running)
+            elif self.policy == 'rr' and self.now == self.slice_end:
+                self.ready.append((self.running_seq, self.running))
+                self.running = None
+
+    def drain(self):
+        return self.advance(math.inf)
+
+
+def schedule_stream(policy, processes, time_quantum=None):
+    # Generator form: feed processes in arrival order (e.g. iter_processes_from_file) and
+    # get every process back as soon as it completes
+    scheduler = OnlineScheduler(policy, time_quantum)
+    for process in processes:
+        yield from scheduler.advance(process.arrival_time)
+        scheduler.submit(process)
+    yield from scheduler.drain()
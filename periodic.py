@@ -0,0 +1,181 @@
+import argparse
+import heapq
+import math
+from array import array
+from fractions import Fraction
+
+from instrumentation import percentile
+from process_table import TYPECODE, parse_time
+
+
+class PeriodicTask:
+    # Releases a job of `wcet` time units at offset, offset + period, ...; each job should
+    # finish within `deadline` of its release (the period when not given)
+    __slots__ = ('task_id', 'offset', 'wcet', 'period', 'deadline')
+
+    def __init__(self, task_id, offset, wcet, period, deadline=None):
+        if period <= 0:
+            raise ValueError(f"task {task_id}: period must be positive")
+        self.task_id = task_id
+        self.offset = offset
+        self.wcet = wcet
+        self.period = period
+        self.deadline = period if deadline is None else deadline
+
+
+def parse_task_line(line):
+    fields = line.split()
+    if len(fields) not in (4, 5):
+        raise ValueError(f"expected 4 or 5 columns, got {len(fields)}")
+    return PeriodicTask(int(fields[0]), *map(parse_time, fields[1:]))
+
+
+def get_periodic_tasks_from_file(file_path):
+    # Mỗi dòng: task_id offset wcet period [deadline]
+    from main import report_invalid_lines
+
+    tasks = []
+    errors = []
+    with open(file_path, 'r') as file:
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                tasks.append(parse_task_line(line))
+            except ValueError:
+                errors.append((line_number, line.rstrip('\n')))
+    report_invalid_lines(file_path, errors)
+    return tasks
+
+
+def hyperperiod(tasks):
+    if not tasks:
+        return 0
+    # Least common multiple of the periods; rational periods use lcm(numerators) / gcd(denominators)
+    periods = [Fraction(task.period) for task in tasks]
+    common = Fraction(math.lcm(*(period.numerator for period in periods)),
+                      math.gcd(*(period.denominator for period in periods)))
+    if common.denominator == 1:
+        common = common.numerator
+    return common + max(task.offset for task in tasks)
+
+
+def _run_periodic(tasks, job_key, horizon, timeline=None, stats=None):
+    # Preemptive single-CPU run of every job released before `horizon`. Only the next release of
+    # each task is kept in a heap, so job instances are created as time reaches them.
+    if horizon is None:
+        horizon = hyperperiod(tasks)
+    releases = [(task.offset, k) for k, task in enumerate(tasks)]
+    heapq.heapify(releases)
+    ready = []  # Heap of [key, remaining, task index, release time]
+    integral = all(type(value) is int
+                   for task in tasks for value in (task.offset, task.wcet, task.period, task.deadline))
+    response_times = array(TYPECODE) if integral else []  # Fractional times do not fit int64
+    jobs = [0] * len(tasks)
+    misses = [0] * len(tasks)
+    worst_response = [0] * len(tasks)
+    curr_time = 0
+    running = None
+    loop_iterations = heap_operations = preemptions = idle_jumps = idle_time = 0
+    while True:
+        loop_iterations += 1
+        while releases and releases[0][0] <= curr_time:
+            release, k = heapq.heappop(releases)
+            heap_operations += 1
+            if release >= horizon:
+                continue  # The task is done for this run
+            heapq.heappush(releases, (release + tasks[k].period, k))
+            heap_operations += 1
+            jobs[k] += 1
+            if tasks[k].wcet > 0:
+                heapq.heappush(ready, [job_key(k, release), tasks[k].wcet, k, release])
+                heap_operations += 1
+            else:
+                response_times.append(0)  # Nothing to run: done as soon as it is released
+        if not ready:
+            if not releases:
+                break
+            idle_jumps += 1
+            idle_time += releases[0][0] - curr_time
+            curr_time = releases[0][0]  # Skip the idle gap
+            continue
+
+        job = ready[0]
+        if running is not None and running is not job and running[1] > 0:
+            preemptions += 1
+        running = job
+        stop = curr_time + job[1]
+        if releases and releases[0][0] < stop:
+            stop = releases[0][0]  # A release may bring a more urgent job
+        if timeline is not None:
+            timeline.add(curr_time, stop, tasks[job[2]].task_id)
+        job[1] = curr_time + job[1] - stop  # Exactly 0 at the finish, even for floats
+        curr_time = stop
+        if job[1] == 0:
+            heapq.heappop(ready)
+            heap_operations += 1
+            _, _, k, release = job
+            response_times.append(curr_time - release)
+            worst_response[k] = max(worst_response[k], curr_time - release)
+            if curr_time > release + tasks[k].deadline:
+                misses[k] += 1
+
+    if stats is not None:
+        stats.update(loop_iterations=loop_iterations, heap_operations=heap_operations, preemptions=preemptions,
+                     idle_jumps=idle_jumps, idle_time=idle_time)
+    response_times = sorted(response_times)
+    total_jobs = sum(jobs)
+    return {
+        'horizon': horizon,
+        'jobs': total_jobs,
+        'deadline_misses': sum(misses),
+        'miss_ratio': sum(misses) / total_jobs if total_jobs else 0.0,
+        'response_p50': percentile(response_times, 50),
+        'response_p95': percentile(response_times, 95),
+        'response_p99': percentile(response_times, 99),
+        'response_max': response_times[-1] if response_times else 0,
+        'tasks': [{'task_id': task.task_id, 'jobs': jobs[k], 'deadline_misses': misses[k],
+                   'worst_response': worst_response[k]} for k, task in enumerate(tasks)],
+    }
+
+
+def edf(tasks, horizon=None, timeline=None, stats=None):
+    # Earliest deadline first: the job with the earliest absolute deadline runs
+    return _run_periodic(tasks, lambda k, release: (release + tasks[k].deadline, release, k),
+                         horizon, timeline, stats)
+
+
+def rate_monotonic(tasks, horizon=None, timeline=None, stats=None):
+    # Fixed priorities: the shorter the period, the higher the priority
+    return _run_periodic(tasks, lambda k, release: (tasks[k].period, k, release), horizon, timeline, stats)
+
+
+ENGINES = {
+    'edf': (edf, "EDF (Earliest Deadline First)"),
+    'rm': (rate_monotonic, "RM (Rate Monotonic)"),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Schedule periodic tasks with EDF or rate monotonic.")
+    parser.add_argument('task_file', help="lines of: task_id offset wcet period [deadline]")
+    parser.add_argument('--policy', default='edf', choices=sorted(ENGINES))
+    parser.add_argument('--horizon', type=parse_time, help="release jobs until this time (default: one hyperperiod)")
+    args = parser.parse_args()
+
+    tasks = get_periodic_tasks_from_file(args.task_file)
+    engine, label = ENGINES[args.policy]
+    summary = engine(tasks, args.horizon)
+    print(f"\nResult Table {label} until t={summary['horizon']}:")
+    print("TaskID\tJobs\tDeadlineMisses\tWorstResponse")
+    for task in summary['tasks']:
+        print(f"{task['task_id']}\t\t{task['jobs']}\t\t{task['deadline_misses']}\t\t\t\t{task['worst_response']}")
+    print(f"\nJobs: {summary['jobs']}")
+    print(f"Deadline Misses: {summary['deadline_misses']} ({summary['miss_ratio']:.2%})")
+    # Comma-separated: fractional times print as e.g. 3/2
+    print(f"Response Time p50, p95, p99, max: {summary['response_p50']}, {summary['response_p95']}, "
+          f"{summary['response_p99']}, {summary['response_max']}")
+
+
+if __name__ == "__main__":
+    main()
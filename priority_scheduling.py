@@ -1,3 +1,9 @@
+from main import priority_preemptive as _priority_preemptive
+from main import round_robin as _round_robin
+from process_table import parse_time
+from timeline import Timeline, render_gantt
+
+
 class Process:
     def __init__(self, process_id, arrival_time, burst_time, priority):
         self.process_id = process_id
@@ -11,32 +17,8 @@ class Process:
 
 
 def priority_preemptive(processes):
-    def find_max_prior_arrived(currTime, lst):
-        available_processes = [process for process in lst if
-                               process.arrival_time <= currTime and process.remaining_time > 0]
-        if available_processes:
-            available_processes.sort(key=lambda x: x.priority)
-            return available_processes[0], True
-        return None, False
-
-    def all_done(lst):
-        return all(process.remaining_time == 0 for process in lst)
-
-    curr_time = 0
-    while not all_done(processes):
-        process, has_arrived = find_max_prior_arrived(curr_time, processes)
-        if not has_arrived:
-            curr_time += 1
-            continue
-
-        process.remaining_time -= 1
-        curr_time += 1
-        if process.remaining_time == 0:
-            process.completion_time = curr_time
-            process.turnaround_time = process.completion_time - process.arrival_time
-            process.waiting_time = process.turnaround_time - process.burst_time
-
-    return processes
+    # The priority_preemptive of main.py: ready heap on (priority, list position), idle gaps skipped
+    return _priority_preemptive(processes)
 
 def priority_non_preemptive(processes):
     processes.sort(key=lambda x: (x.priority, x.arrival_time))  # Sắp xếp tiến trình theo ưu tiên và thời gian xuất hiện
@@ -74,32 +56,8 @@ def sjf_non_preemptive(processes):
     return processes
 
 def round_robin(processes, time_quantum):
-    queue = []
-    processed_processes = []
-    curr_time = 0
-
-    while processes or queue:
-        while processes and processes[0].arrival_time <= curr_time:
-            queue.append(processes.pop(0))
-
-        if queue:
-            process = queue.pop(0)
-            if process.remaining_time <= time_quantum:
-                curr_time += process.remaining_time
-                process.remaining_time = 0
-                process.completion_time = curr_time
-                process.turnaround_time = process.completion_time - process.arrival_time
-                process.waiting_time = process.turnaround_time - process.burst_time
-                processed_processes.append(process)
-            else:
-                curr_time += time_quantum
-                process.remaining_time -= time_quantum
-                queue.append(process)
-
-        else:
-            curr_time += 1
-
-    return processed_processes
+    # The round robin of main.py: deque queue with O(1) operations, idle gaps skipped
+    return _round_robin(processes, time_quantum)
 
 def average_turnaround_time(processes):
     return sum(process.turnaround_time for process in processes) / len(processes)
@@ -110,26 +68,21 @@ def average_waiting_time(processes):
 
 
 def generate_gantt_chart(processes):
-    gantt_chart = " "
+    # Scaled to a fixed width, so the chart does not grow with the time unit
+    timeline = Timeline()
     curr_time = 0
-
     for process in processes:
-        gantt_chart += "|"
-        for i in range(process.completion_time - curr_time):
-            gantt_chart += "-"
-        gantt_chart += f"P{process.process_id}"
-        curr_time = process.completion_time
-
-    gantt_chart += "|"
-    return gantt_chart
+        timeline.add(curr_time, process.completion_time, process.process_id)
+        curr_time = max(curr_time, process.completion_time)
+    return render_gantt(timeline)
 def get_processes_from_file(file_path):
     processes = []
     with open(file_path, 'r') as file:
         lines = file.readlines()
         for line in lines:
             process_data = line.split()
-            process_id, arrival_time, burst_time, priority = map(int, process_data)
-            process = Process(process_id, arrival_time, burst_time, priority)
+            process = Process(int(process_data[0]), parse_time(process_data[1]), parse_time(process_data[2]),
+                              int(process_data[3]))
             processes.append(process)
     return processes
 def compare_algorithms():
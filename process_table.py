@@ -0,0 +1,153 @@
+from array import array
+from fractions import Fraction
+from operator import itemgetter
+
+
+# Bảng tiến trình dạng cột: mỗi thuộc tính của Process là một mảng kiểu cố định
+COLUMNS = ('ids', 'arrival', 'burst', 'priority', 'remaining', 'completion', 'turnaround', 'waiting')
+INPUT_COLUMNS = ('ids', 'arrival', 'burst', 'priority')
+RESULT_COLUMNS = ('remaining', 'completion', 'turnaround', 'waiting')
+TYPECODE = 'q'
+ITEM_SIZE = array(TYPECODE).itemsize
+
+
+def parse_time(text):
+    # Whole numbers stay int, however large (e.g. nanosecond timestamps); decimals and
+    # ratios such as 2.5, 1e-6 or 1/3 become exact Fractions
+    try:
+        return int(text)
+    except ValueError:
+        return Fraction(text)
+
+
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def fits_table(processes):
+    # Table columns are int64, so workloads with fractional times, or whose values could leave the
+    # int64 range, stay lists of Process. No completion time exceeds latest arrival + total burst.
+    if isinstance(processes, ProcessTable):
+        return True
+    latest = total = 0
+    for process in processes:
+        arrival, burst = process.arrival_time, process.burst_time
+        if type(arrival) is not int or type(burst) is not int:
+            return False
+        if not (INT64_MIN <= arrival and INT64_MIN <= process.process_id <= INT64_MAX
+                and INT64_MIN <= (process.priority or 0) <= INT64_MAX):
+            return False
+        latest = max(latest, arrival)
+        total += burst
+    return latest + total <= INT64_MAX
+
+
+def _column_property(column):
+    def getter(row):
+        return getattr(row.table, column)[row.index]
+
+    def setter(row, value):
+        getattr(row.table, column)[row.index] = value
+
+    return property(getter, setter)
+
+
+class ProcessRow:
+    # View of one row of a ProcessTable with the same attributes as Process
+    __slots__ = ('table', 'index')
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    process_id = _column_property('ids')
+    arrival_time = _column_property('arrival')
+    burst_time = _column_property('burst')
+    priority = _column_property('priority')
+    remaining_time = _column_property('remaining')
+    completion_time = _column_property('completion')
+    turnaround_time = _column_property('turnaround')
+    waiting_time = _column_property('waiting')
+
+
+class ProcessTable:
+    __slots__ = COLUMNS
+
+    def __init__(self):
+        for column in COLUMNS:
+            setattr(self, column, array(TYPECODE))
+
+    @classmethod
+    def from_processes(cls, processes):
+        table = cls()
+        for process in processes:
+            table.append(process.process_id, process.arrival_time, process.burst_time, process.priority)
+            table.remaining[-1] = process.remaining_time
+            table.completion[-1] = process.completion_time
+            table.turnaround[-1] = process.turnaround_time
+            table.waiting[-1] = process.waiting_time
+        return table
+
+    def append(self, process_id, arrival_time, burst_time, priority=0):
+        self.ids.append(int(process_id))
+        self.arrival.append(arrival_time)
+        self.burst.append(burst_time)
+        self.priority.append(priority if priority != '' else 0)  # File 3 cột không có độ ưu tiên
+        self.remaining.append(burst_time)
+        self.completion.append(0)
+        self.turnaround.append(0)
+        self.waiting.append(0)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.ids)
+        if not 0 <= index < len(self.ids):
+            raise IndexError("process table index out of range")
+        return ProcessRow(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.ids)):
+            yield ProcessRow(self, index)
+
+    def sort(self, key):
+        # Same contract as list.sort: stable, in place, key receives a Process-like row
+        self.permute(sorted(range(len(self.ids)), key=lambda i: key(ProcessRow(self, i))))
+
+    def permute(self, order):
+        # Row k becomes the old row order[k]
+        columns = [(column, getattr(self, column)) for column in COLUMNS]
+        if len(order) < 2:
+            gather = lambda values: [values[i] for i in order]
+        else:
+            gather = itemgetter(*order)  # One C call per column instead of a Python loop
+        for column, values in columns:
+            setattr(self, column, array(TYPECODE, gather(values)))
+
+    def __getattr__(self, name):
+        # Result columns are allocated on first use, e.g. after reset() or for a mapped table
+        if name not in RESULT_COLUMNS:
+            raise AttributeError(name)
+        if name == 'remaining':
+            values = array(TYPECODE, bytes(self.burst))
+        else:
+            values = array(TYPECODE, bytes(len(self.ids) * ITEM_SIZE))
+        setattr(self, name, values)
+        return values
+
+    def copy(self):
+        # New table with the same input columns and fresh result columns
+        table = ProcessTable()
+        for column in INPUT_COLUMNS:
+            getattr(table, column).frombytes(memoryview(getattr(self, column)).cast('B'))
+        table.reset()
+        return table
+
+    def reset(self):
+        # Clear results from a previous run so the table can be scheduled again
+        for column in RESULT_COLUMNS:
+            try:
+                delattr(self, column)
+            except AttributeError:
+                pass
@@ -0,0 +1,103 @@
+import hashlib
+import json
+import os
+import pickle
+
+CACHE_DIR = ".result_cache"
+MAX_CACHE_BYTES = 256 * 2 ** 20
+DIGEST_FILE = "digests.json"
+# Part of every key: bump it whenever an engine's results or the entry layout change,
+# so entries written by older code are never served
+CACHE_VERSION = 1
+
+
+class ResultCache:
+    # On-disk cache of algorithm results keyed by (workload contents, algorithm, parameters).
+    # Entries are evicted least-recently-used first once the directory grows past max_bytes;
+    # a hit refreshes the entry's modification time.
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=MAX_CACHE_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._digests = None
+
+    def _load_digests(self):
+        if self._digests is None:
+            try:
+                with open(os.path.join(self.directory, DIGEST_FILE)) as file:
+                    self._digests = json.load(file)
+            except (OSError, ValueError):
+                self._digests = {}
+        return self._digests
+
+    def workload_digest(self, file_path):
+        # SHA-256 of the file contents, remembered per (path, size, mtime) so unchanged
+        # workloads are not re-read on every run
+        status = os.stat(file_path)
+        digests = self._load_digests()
+        path = os.path.abspath(file_path)
+        known = digests.get(path)
+        if known and known['size'] == status.st_size and known['mtime_ns'] == status.st_mtime_ns:
+            return known['sha256']
+
+        sha256 = hashlib.sha256()
+        with open(file_path, 'rb') as file:
+            for block in iter(lambda: file.read(1 << 20), b''):
+                sha256.update(block)
+        digests[path] = {'size': status.st_size, 'mtime_ns': status.st_mtime_ns, 'sha256': sha256.hexdigest()}
+        os.makedirs(self.directory, exist_ok=True)
+        self._write_atomic(DIGEST_FILE, json.dumps(digests).encode())
+        return digests[path]['sha256']
+
+    def key(self, file_path, algorithm, params=None):
+        params = json.dumps(params or {}, sort_keys=True, default=str)  # default=str: Fraction parameters
+        text = "\0".join([str(CACHE_VERSION), self.workload_digest(file_path), algorithm, params])
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.directory, key + ".pkl")
+
+    def _write_atomic(self, name, data):
+        path = os.path.join(self.directory, name)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as file:
+            file.write(data)
+        os.replace(temp_path, path)
+
+    def get(self, key):
+        path = self._entry_path(key)
+        try:
+            with open(path, 'rb') as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError):
+            self._remove(path)  # Truncated or corrupt entry: treat it as a miss
+            return None
+        os.utime(path)
+        return value
+
+    def put(self, key, value):
+        os.makedirs(self.directory, exist_ok=True)
+        self._write_atomic(key + ".pkl", pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        self.evict()
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def evict(self):
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.endswith(".pkl"):
+                    status = entry.stat()
+                    entries.append((status.st_mtime_ns, status.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
@@ -0,0 +1,119 @@
+import argparse
+import json
+import sqlite3
+import time
+
+STORE_PATH = "results.db"
+METRICS = ('avg_waiting_time', 'avg_turnaround_time')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    kind TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    result_id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    algorithm TEXT NOT NULL,
+    algorithm_type TEXT NOT NULL,
+    params TEXT NOT NULL,
+    input_file TEXT NOT NULL,
+    process_count INTEGER NOT NULL,
+    avg_waiting_time REAL NOT NULL,
+    avg_turnaround_time REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_by_waiting ON results (input_file, avg_waiting_time);
+CREATE INDEX IF NOT EXISTS results_by_turnaround ON results (input_file, avg_turnaround_time);
+CREATE INDEX IF NOT EXISTS results_by_algorithm ON results (algorithm, input_file);
+"""
+
+
+class ResultStore:
+    # Append-only store: one row per (run, algorithm, input, params). Nothing is ever rewritten;
+    # rankings come from the indexes and text reports are generated on demand.
+
+    def __init__(self, path=STORE_PATH):
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def start_run(self, kind):
+        with self.connection:
+            cursor = self.connection.execute("INSERT INTO runs (started_at, kind) VALUES (?, ?)", (time.time(), kind))
+        return cursor.lastrowid
+
+    def add_result(self, run_id, algorithm, algorithm_type, params, input_file, process_count,
+                   avg_waiting_time, avg_turnaround_time):
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO results (run_id, algorithm, algorithm_type, params, input_file, process_count, "
+                "avg_waiting_time, avg_turnaround_time) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (run_id, algorithm, algorithm_type, json.dumps(params or {}, sort_keys=True, default=str), input_file,
+                 process_count, avg_waiting_time, avg_turnaround_time))
+
+    def ranked(self, metric='avg_waiting_time', input_file=None, algorithm=None, limit=None):
+        # Best results first; ties keep insertion order
+        if metric not in METRICS:
+            raise ValueError(f"unknown metric {metric!r}, expected one of {', '.join(METRICS)}")
+        query = "SELECT * FROM results"
+        conditions, arguments = [], []
+        if input_file is not None:
+            conditions.append("input_file = ?")
+            arguments.append(input_file)
+        if algorithm is not None:
+            conditions.append("algorithm = ?")
+            arguments.append(algorithm)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY {metric}, result_id"
+        if limit is not None:
+            query += " LIMIT ?"
+            arguments.append(limit)
+        return self.connection.execute(query, arguments).fetchall()
+
+    def write_report(self, file_path, metric='avg_waiting_time', input_file=None, algorithm=None, limit=None):
+        # The old output.txt layout, sorted by `metric`, now with turnaround time kept
+        rows = self.ranked(metric, input_file, algorithm, limit)
+        with open(file_path, 'w') as file:
+            for row in rows:
+                file.write(f"--------------------------------------\n")
+                file.write(f"Results using {row['algorithm_type']}:\n")
+                file.write(f"Average Waiting Time: {row['avg_waiting_time']}\n")
+                file.write(f"Average Turnaround Time: {row['avg_turnaround_time']}\n")
+                file.write(f"Input File: {row['input_file'].upper()}\n")
+                file.write("\n")
+        return len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rank stored scheduling results or write a text report.")
+    parser.add_argument('--store', default=STORE_PATH)
+    parser.add_argument('--metric', default='avg_waiting_time', choices=METRICS)
+    parser.add_argument('--input', help="only results for this input file")
+    parser.add_argument('--algorithm', help="only results for this algorithm, e.g. round_robin")
+    parser.add_argument('--limit', type=int)
+    parser.add_argument('--report', metavar='FILE', help="write the ranking in the output.txt layout")
+    args = parser.parse_args()
+
+    with ResultStore(args.store) as store:
+        if args.report:
+            count = store.write_report(args.report, args.metric, args.input, args.algorithm, args.limit)
+            print(f"Wrote {count} results to {args.report}")
+            return
+        for row in store.ranked(args.metric, args.input, args.algorithm, args.limit):
+            print(f"{row['avg_waiting_time']:>12.4f} {row['avg_turnaround_time']:>12.4f}  "
+                  f"{row['input_file']}  {row['algorithm_type']}")
+
+
+if __name__ == "__main__":
+    main()
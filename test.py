@@ -0,0 +1,622 @@
+import io
+import os
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from collections import deque
+from fractions import Fraction
+from unittest import mock
+
+import main
+
+from binary_workload import HEADER, convert_text_workload, load_binary_workload
+from io_bursts import IO_POLICIES, BurstProcess, simulate_bursts
+from main import (Process, cfs, fcfs, get_processes_from_file, lottery_scheduling, mlfq, priority_non_preemptive,
+                  priority_preemptive, round_robin, round_robin_quantum_sweep, sjf_non_preemptive, srtf_preemptive,
+                  stride_scheduling)
+from multicore import simulate_multicore
+from online import POLICIES, OnlineScheduler, schedule_stream
+from periodic import PeriodicTask, edf, hyperperiod, rate_monotonic
+from process_table import ProcessTable, fits_table
+from timeline import Timeline
+
+TRIALS = 300
+
+
+# Per-tick reference versions: time moves one unit per step, as the engines did before they
+# became event-driven. A workload is a list of (process_id, arrival, burst, priority) and each
+# reference returns {process_id: completion_time}.
+
+def tick_priority_preemptive(workload):
+    remaining = [burst for _, _, burst, _ in workload]
+    completion = {}
+    curr_time = 0
+    while len(completion) < len(workload):
+        arrived = [i for i, (_, arrival, _, _) in enumerate(workload) if arrival <= curr_time and remaining[i] > 0]
+        curr_time += 1
+        if arrived:
+            i = min(arrived, key=lambda i: workload[i][3])  # Ties: earlier in the list
+            remaining[i] -= 1
+            if remaining[i] == 0:
+                completion[workload[i][0]] = curr_time
+    return completion
+
+
+def tick_srtf(workload):
+    order = sorted(range(len(workload)), key=lambda i: workload[i][1])
+    remaining = [burst for _, _, burst, _ in workload]
+    completion = {}
+    curr_time = 0
+    while len(completion) < len(workload):
+        arrived = [i for i in order if workload[i][1] <= curr_time and remaining[i] > 0]
+        curr_time += 1
+        if arrived:
+            i = min(arrived, key=remaining.__getitem__)  # Ties: earlier arrival
+            remaining[i] -= 1
+            if remaining[i] == 0:
+                completion[workload[i][0]] = curr_time
+    return completion
+
+
+def tick_round_robin(workload, time_quantum):
+    pending = deque(sorted(range(len(workload)), key=lambda i: workload[i][1]))
+    remaining = [burst for _, _, burst, _ in workload]
+    queue = deque()
+    completion = {}
+    curr_time = 0
+    while pending or queue:
+        while pending and workload[pending[0]][1] <= curr_time:
+            queue.append(pending.popleft())
+        if not queue:
+            curr_time += 1
+            continue
+        i = queue.popleft()
+        for _ in range(min(time_quantum, remaining[i])):
+            curr_time += 1
+            remaining[i] -= 1
+        if remaining[i] == 0:
+            completion[workload[i][0]] = curr_time
+        else:
+            queue.append(i)
+    return completion
+
+
+def tick_non_preemptive(workload, key):
+    # When the CPU is free, start the arrived process with the smallest (key, arrival, list position)
+    waiting = list(range(len(workload)))
+    completion = {}
+    curr_time = 0
+    while waiting:
+        arrived = [i for i in waiting if workload[i][1] <= curr_time]
+        if not arrived:
+            curr_time += 1
+            continue
+        i = min(arrived, key=lambda i: (key(workload[i]), workload[i][1], i))
+        waiting.remove(i)
+        for _ in range(workload[i][2]):
+            curr_time += 1
+        completion[workload[i][0]] = curr_time
+    return completion
+
+
+def tick_mlfq(workload, quanta, boost_interval):
+    # Arrivals wait in `staged` until the running process gives up the CPU; a boost at every
+    # multiple of boost_interval moves everyone to level 0 with a fresh quantum
+    count = len(workload)
+    order = sorted(range(count), key=lambda i: workload[i][1])
+    remaining = [burst for _, _, burst, _ in workload]
+    levels = [deque() for _ in quanta]
+    level = [0] * count
+    budget = [quanta[0]] * count
+    staged = []
+    completion = {}
+    running = None
+    next_arrival = 0
+    curr_time = 0
+    while len(completion) < count:
+        while next_arrival < count and workload[order[next_arrival]][1] <= curr_time:
+            staged.append(order[next_arrival])
+            next_arrival += 1
+        boost = boost_interval and curr_time > 0 and curr_time % boost_interval == 0
+        if running is not None:
+            i = running
+            if remaining[i] == 0:
+                completion[workload[i][0]] = curr_time
+                running = None
+            elif budget[i] == 0:
+                level[i] = min(level[i] + 1, len(quanta) - 1)
+                budget[i] = quanta[level[i]]
+                levels[level[i]].append(i)
+                running = None
+            elif (staged and level[i] > 0) or boost:
+                levels[level[i]].appendleft(i)
+                running = None
+        if running is None:
+            levels[0].extend(staged)
+            staged = []
+            if boost:
+                merged = deque(i for queue in levels for i in queue)
+                levels = [merged] + [deque() for _ in quanta[1:]]
+                for i in merged:
+                    level[i], budget[i] = 0, quanta[0]
+            running = next((queue.popleft() for queue in levels if queue), None)
+        if running is not None:
+            remaining[running] -= 1
+            budget[running] -= 1
+        curr_time += 1
+    return completion
+
+
+def random_workload(rng, max_count=15, max_arrival=40, max_burst=12, priorities=4):
+    return [(i, rng.randint(0, max_arrival), rng.randint(1, max_burst), rng.randrange(priorities))
+            for i in range(rng.randint(1, max_count))]
+
+
+def processes_of(workload):
+    return [Process(*record) for record in workload]
+
+
+def completions(processes):
+    return {process.process_id: process.completion_time for process in processes}
+
+
+class EventEnginesMatchTickReferences(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(1)
+
+    def test_priority_preemptive(self):
+        for _ in range(TRIALS):
+            workload = random_workload(self.rng)
+            self.assertEqual(completions(priority_preemptive(processes_of(workload))),
+                             tick_priority_preemptive(workload), workload)
+
+    def test_srtf(self):
+        for _ in range(TRIALS):
+            workload = random_workload(self.rng)
+            self.assertEqual(completions(srtf_preemptive(processes_of(workload))), tick_srtf(workload), workload)
+
+    def test_round_robin(self):
+        for _ in range(TRIALS):
+            workload = random_workload(self.rng)
+            time_quantum = self.rng.randint(1, 5)
+            self.assertEqual(completions(round_robin(processes_of(workload), time_quantum)),
+                             tick_round_robin(workload, time_quantum), (workload, time_quantum))
+
+    def test_non_preemptive(self):
+        for _ in range(TRIALS):
+            workload = random_workload(self.rng)
+            self.assertEqual(completions(fcfs(processes_of(workload))),
+                             tick_non_preemptive(workload, lambda record: record[1]), workload)
+            self.assertEqual(completions(sjf_non_preemptive(processes_of(workload))),
+                             tick_non_preemptive(workload, lambda record: record[2]), workload)
+            self.assertEqual(completions(priority_non_preemptive(processes_of(workload))),
+                             tick_non_preemptive(workload, lambda record: record[3]), workload)
+
+    def test_mlfq(self):
+        for _ in range(TRIALS):
+            workload = random_workload(self.rng, max_burst=25)
+            quanta = tuple(self.rng.randint(1, 6) for _ in range(self.rng.randint(1, 4)))
+            boost_interval = self.rng.choice([None, self.rng.randint(3, 30)])
+            self.assertEqual(completions(mlfq(processes_of(workload), quanta, boost_interval)),
+                             tick_mlfq(workload, quanta, boost_interval), (workload, quanta, boost_interval))
+
+
+class SharedResults(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(2)
+
+    def test_quantum_sweep_matches_round_robin(self):
+        for _ in range(TRIALS // 3):
+            workload = random_workload(self.rng)
+            quanta = sorted(self.rng.sample(range(1, 10), 4))
+            for time_quantum, avg_waiting, avg_turnaround in round_robin_quantum_sweep(processes_of(workload), quanta):
+                processes = round_robin(processes_of(workload), time_quantum)
+                count = len(processes)
+                self.assertAlmostEqual(avg_turnaround, sum(p.turnaround_time for p in processes) / count)
+                self.assertAlmostEqual(avg_waiting, sum(p.waiting_time for p in processes) / count)
+
+    def test_process_table_matches_list(self):
+        engines = [fcfs, sjf_non_preemptive, srtf_preemptive, priority_preemptive, priority_non_preemptive,
+                   lambda processes: round_robin(processes, 3), lambda processes: mlfq(processes, (2, 4), 20)]
+        for _ in range(TRIALS // 3):
+            workload = random_workload(self.rng)
+            for engine in engines:
+                table = engine(ProcessTable.from_processes(processes_of(workload)))
+                self.assertEqual({row.process_id: row.completion_time for row in table},
+                                 completions(engine(processes_of(workload))), workload)
+
+    def test_result_order_does_not_depend_on_aging(self):
+        # An aging_interval far beyond the workload never changes the schedule or the result order
+        for _ in range(TRIALS // 3):
+            workload = random_workload(self.rng)
+            for engine in (priority_preemptive, priority_non_preemptive):
+                for make in (processes_of, lambda workload: ProcessTable.from_processes(processes_of(workload))):
+                    plain = [p.process_id for p in engine(make(workload))]
+                    aged = engine(make(workload), aging_interval=10 ** 9)
+                    self.assertEqual([p.process_id for p in aged], plain, workload)
+            self.assertEqual(completions(priority_non_preemptive(processes_of(workload), aging_interval=10 ** 9)),
+                             completions(priority_non_preemptive(processes_of(workload))))
+
+    def test_one_core_multicore_matches_main(self):
+        engines = {'fcfs': fcfs, 'sjf': sjf_non_preemptive, 'srtf': srtf_preemptive,
+                   'priority_preemptive': priority_preemptive, 'priority_non_preemptive': priority_non_preemptive,
+                   'rr': lambda processes: round_robin(processes, 3)}
+        for _ in range(TRIALS // 3):
+            workload = random_workload(self.rng)
+            for policy, engine in engines.items():
+                expected = completions(engine(processes_of(workload)))
+                for placement in ('global', 'per_core'):
+                    processes = simulate_multicore(processes_of(workload), policy, 1, placement, 3)
+                    self.assertEqual(completions(processes), expected, (policy, placement, workload))
+
+
+class OnlineMatchesBatch(unittest.TestCase):
+    # Processes are submitted in arrival order, so submission order and list position agree
+
+    ENGINES = {'fcfs': fcfs, 'sjf': sjf_non_preemptive, 'rr': lambda processes: round_robin(processes, 3),
+               'srtf': srtf_preemptive, 'priority_preemptive': priority_preemptive,
+               'priority_non_preemptive': priority_non_preemptive}
+
+    def setUp(self):
+        self.rng = random.Random(12)
+
+    def workloads(self):
+        for _ in range(TRIALS // 3):
+            workload = sorted(random_workload(self.rng), key=lambda record: record[1])
+            expected = {policy: completions(engine(processes_of(workload))) for policy, engine in self.ENGINES.items()}
+            yield workload, expected
+
+    def test_schedule_stream(self):
+        self.assertEqual(set(self.ENGINES), set(POLICIES))
+        for workload, expected in self.workloads():
+            for policy in POLICIES:
+                processes = list(schedule_stream(policy, processes_of(workload), 3 if policy == 'rr' else None))
+                self.assertEqual(completions(processes), expected[policy], (policy, workload))
+                self.assertEqual([p.completion_time for p in processes],
+                                 sorted(p.completion_time for p in processes))
+
+    def test_advance_in_uneven_steps(self):
+        # Sometimes submit ahead of time, sometimes advance in several steps up to the next arrival
+        for workload, expected in self.workloads():
+            for policy in POLICIES:
+                scheduler = OnlineScheduler(policy, 3 if policy == 'rr' else None)
+                processes = []
+                for process in processes_of(workload):
+                    while self.rng.random() < 0.6 and scheduler.now < process.arrival_time:
+                        processes += scheduler.advance(self.rng.randint(scheduler.now, process.arrival_time))
+                    scheduler.submit(process)
+                processes += scheduler.advance(self.rng.randint(scheduler.now, scheduler.now + 20))
+                processes += scheduler.drain()
+                self.assertEqual(completions(processes), expected[policy], (policy, workload))
+                self.assertEqual(len(scheduler), 0)
+
+    def test_priority_ties_go_to_the_earlier_submission(self):
+        # P1 is submitted first but arrives later; on equal priority it takes the CPU from P2 at t = 2,
+        # as it does in the batch function when it comes first in the list
+        scheduler = OnlineScheduler('priority_preemptive')
+        scheduler.submit(Process(1, 2, 3, 0))
+        scheduler.submit(Process(2, 0, 3, 0))
+        self.assertEqual(completions(scheduler.drain()), {1: 5, 2: 6})
+        self.assertEqual(completions(priority_preemptive([Process(1, 2, 3, 0), Process(2, 0, 3, 0)])), {1: 5, 2: 6})
+
+
+class ProportionalShare(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(22)
+
+    def test_ticket_tree_find_matches_a_linear_scan(self):
+        for _ in range(TRIALS // 3):
+            tickets = [self.rng.choice([0, self.rng.randint(1, 50)]) for _ in range(self.rng.randint(1, 40))]
+            tree = main._TicketTree(len(tickets))
+            for slot, count in enumerate(tickets):
+                tree.add(slot, count)
+            for slot in self.rng.sample(range(len(tickets)), len(tickets) // 3):
+                tree.add(slot, -tickets[slot])
+                tickets[slot] = 0
+            self.assertEqual(tree.total, sum(tickets))
+            owners = [slot for slot, count in enumerate(tickets) for _ in range(count)]
+            self.assertEqual([tree.find(ticket) for ticket in range(tree.total)], owners)
+
+    def test_lottery_is_reproducible_for_a_seed(self):
+        workload = [(i, 0, 200, i % 4) for i in range(6)]
+        runs = {}
+        for seed in (0, 0, 1):
+            timeline = Timeline()
+            lottery_scheduling(processes_of(workload), 4, seed, timeline)
+            runs.setdefault(seed, []).append(list(timeline))
+        self.assertEqual(runs[0][0], runs[0][1])
+        self.assertNotEqual(runs[0][0], runs[1][0])
+
+    def test_cpu_share_follows_the_weights(self):
+        # Priority 0 and 5 weigh 1024 and 335: until the heavier process finishes it gets 3.06 times the CPU
+        for engine, tolerance in ((stride_scheduling, 0.01), (lottery_scheduling, 0.05)):
+            timeline = Timeline()
+            processes = engine([Process(1, 0, 40000, 0), Process(2, 0, 40000, 5)], 4, timeline=timeline)
+            first = min(process.completion_time for process in processes)
+            share = {1: 0, 2: 0}
+            for start, end, pid in timeline:
+                share[pid] += max(0, min(end, first) - start)
+            self.assertAlmostEqual(share[1] / share[2] / (1024 / 335), 1, delta=tolerance)
+
+
+class PeriodicTasks(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(23)
+
+    def random_tasks(self, max_utilization):
+        # Implicit deadlines, random offsets, total utilization at most max_utilization
+        while True:
+            count = self.rng.randint(1, 5)
+            tasks = []
+            for task_id in range(count):
+                period = self.rng.randint(2, 12)
+                wcet = self.rng.randint(1, max(1, 2 * period // count))
+                tasks.append(PeriodicTask(task_id, self.rng.randint(0, 5), wcet, period))
+            if sum(Fraction(task.wcet, task.period) for task in tasks) <= max_utilization:
+                return tasks
+
+    def test_edf_meets_every_deadline_up_to_full_utilization(self):
+        for _ in range(TRIALS):
+            tasks = self.random_tasks(1)
+            self.assertEqual(edf(tasks)['deadline_misses'], 0, [(t.offset, t.wcet, t.period) for t in tasks])
+
+    def test_rate_monotonic_meets_every_deadline_under_the_liu_layland_bound(self):
+        checked = 0
+        while checked < TRIALS:
+            tasks = self.random_tasks(1)
+            if sum(task.wcet / task.period for task in tasks) > len(tasks) * (2 ** (1 / len(tasks)) - 1):
+                continue
+            checked += 1
+            self.assertEqual(rate_monotonic(tasks)['deadline_misses'], 0, [(t.offset, t.wcet, t.period) for t in tasks])
+
+    def test_rate_monotonic_can_miss_where_edf_does_not(self):
+        # Utilization 2/5 + 4/7 is above the two-task bound: the second task's first job ends at 8, after 7
+        tasks = [PeriodicTask(1, 0, 2, 5), PeriodicTask(2, 0, 4, 7)]
+        self.assertEqual(edf(tasks)['deadline_misses'], 0)
+        self.assertGreater(rate_monotonic(tasks)['deadline_misses'], 0)
+
+    def test_hyperperiod_of_rational_periods(self):
+        tasks = [PeriodicTask(1, 0, Fraction(1, 2), Fraction(3, 2)), PeriodicTask(2, 0, Fraction(1, 4), Fraction(5, 4))]
+        self.assertEqual(hyperperiod(tasks), Fraction(15, 2))
+        self.assertEqual(hyperperiod(tasks + [PeriodicTask(3, 1, 1, 3)]), 16)  # lcm 15, plus the largest offset
+        self.assertEqual(hyperperiod([PeriodicTask(1, 0, 1, Fraction(4, 2)), PeriodicTask(2, 0, 1, 3)]), 6)
+        # The same task set in thirds of a time unit: the whole run scales by 1/3
+        for _ in range(TRIALS // 10):
+            tasks = self.random_tasks(1)
+            thirds = [PeriodicTask(task.task_id, Fraction(task.offset, 3), Fraction(task.wcet, 3),
+                                   Fraction(task.period, 3)) for task in tasks]
+            self.assertEqual(hyperperiod(thirds), Fraction(hyperperiod(tasks), 3))
+            for engine in (edf, rate_monotonic):
+                summary, scaled = engine(tasks), engine(thirds)
+                self.assertEqual(scaled['jobs'], summary['jobs'])
+                self.assertEqual(scaled['deadline_misses'], summary['deadline_misses'])
+                self.assertEqual(scaled['response_max'], Fraction(summary['response_max'], 3))
+
+
+class BinaryWorkload(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.text_path = os.path.join(directory.name, 'input.txt')
+        self.binary_path = os.path.join(directory.name, 'input.bin')
+
+    def write_text(self, lines):
+        with open(self.text_path, 'w') as file:
+            file.write('\n'.join(lines) + '\n')
+
+    def test_round_trip_through_an_engine(self):
+        workload = random_workload(random.Random(7), max_count=40)
+        workload.append((99, 2 ** 62, 3, -2))  # Large times and negative priorities survive the trip
+        self.write_text([' '.join(map(str, record)) for record in workload] + ['not a process line'])
+        with redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(convert_text_workload(self.text_path, self.binary_path, chunk_size=8), len(workload))
+        self.assertIn('Skipped 1 invalid line', output.getvalue())
+        table = load_binary_workload(self.binary_path)
+        self.assertEqual([(row.process_id, row.arrival_time, row.burst_time, row.priority) for row in table], workload)
+        for engine in (srtf_preemptive, priority_preemptive, lambda processes: round_robin(processes, 3)):
+            self.assertEqual(completions(engine(load_binary_workload(self.binary_path))),
+                             completions(engine(processes_of(workload))))
+
+    def test_missing_priority_is_zero_in_lists_and_tables(self):
+        # A file mixing 3- and 4-column lines schedules the same as a Process list and as a table
+        self.write_text(['1 0 6', '2 1 3 2', '3 2 2 -1', '4 3 4'])
+        processes = get_processes_from_file(self.text_path)
+        self.assertEqual([process.priority for process in processes], [0, 2, -1, 0])
+        with redirect_stdout(io.StringIO()):
+            convert_text_workload(self.text_path, self.binary_path)
+        for engine in (priority_preemptive, priority_non_preemptive, cfs):
+            self.assertEqual(completions(engine(get_processes_from_file(self.text_path))),
+                             completions(engine(load_binary_workload(self.binary_path))))
+
+    def test_bad_header_is_rejected(self):
+        self.write_text(['1 0 5 1', '2 1 3 0'])
+        with redirect_stdout(io.StringIO()):
+            convert_text_workload(self.text_path, self.binary_path)
+        with open(self.binary_path, 'r+b') as file:
+            file.write(b'XXXX')
+        with self.assertRaises(ValueError):
+            load_binary_workload(self.binary_path)
+        with open(self.binary_path, 'wb') as file:
+            file.write(b'PTBL')  # Shorter than a header
+        with self.assertRaises(ValueError):
+            load_binary_workload(self.binary_path)
+
+    def test_size_mismatch_is_rejected(self):
+        self.write_text(['1 0 5 1', '2 1 3 0'])
+        with redirect_stdout(io.StringIO()):
+            convert_text_workload(self.text_path, self.binary_path)
+        size = os.path.getsize(self.binary_path)
+        self.assertEqual(size, HEADER.size + 4 * 2 * 8)
+        with open(self.binary_path, 'r+b') as file:
+            file.truncate(size - 8)
+        with self.assertRaises(ValueError):
+            load_binary_workload(self.binary_path)
+
+    def test_fractional_times_are_rejected(self):
+        self.write_text(['1 0 5 1', '2 0.5 3 0'])
+        with self.assertRaises(ValueError):
+            convert_text_workload(self.text_path, self.binary_path)
+        self.assertFalse(os.path.exists(self.binary_path))
+
+
+@unittest.skipIf(main.np is None, "NumPy is not installed")
+class NumpyKernel(unittest.TestCase):
+
+    def test_vectorized_fcfs_matches_the_loop(self):
+        # Inputs of at least VECTORIZE_THRESHOLD rows take the NumPy path; a raised threshold forces the loop
+        rng = random.Random(5)
+        for trial in range(4):
+            count = main.VECTORIZE_THRESHOLD + rng.randint(0, 2000)
+            workload = [(i, rng.randint(0, 6 * count), rng.randint(0, 10), rng.randrange(4)) for i in range(count)]
+            for make in (processes_of, lambda workload: ProcessTable.from_processes(processes_of(workload))):
+                runs = []
+                for threshold in (main.VECTORIZE_THRESHOLD, count + 1):
+                    timeline, stats = Timeline(), {}
+                    with mock.patch.object(main, 'VECTORIZE_THRESHOLD', threshold):
+                        processes = fcfs(make(workload), timeline, stats)
+                    runs.append(([(p.process_id, p.completion_time, p.turnaround_time, p.waiting_time)
+                                  for p in processes], list(timeline), stats))
+                (vectorized, vectorized_timeline, vectorized_stats), (loop, loop_timeline, loop_stats) = runs
+                self.assertEqual(vectorized_stats.pop('vectorized'), 1)
+                self.assertNotIn('vectorized', loop_stats)
+                del vectorized_stats['loop_iterations'], loop_stats['loop_iterations']
+                self.assertEqual(vectorized, loop)
+                self.assertEqual(vectorized_timeline, loop_timeline)
+                self.assertEqual(vectorized_stats, loop_stats)
+
+
+class FractionalTimes(unittest.TestCase):
+
+    def test_mlfq_boost_on_float_times(self):
+        # 5.1 // 1.7 == 2.0, so the next boost used to be computed as 5.1 again and mlfq never advanced
+        processes = mlfq([Process(6, 2.1, 1.9, 3), Process(7, 2.2, 1.3, 1)], (0.1, 0.3), 1.7)
+        completion = completions(processes)
+        self.assertAlmostEqual(completion[7], 4.5)
+        self.assertAlmostEqual(completion[6], 5.3)
+
+    def test_cfs_slices_are_not_rounded_to_whole_units(self):
+        # Three 0.1 s jobs with a 20 ms target latency share the CPU instead of running one after another
+        processes = cfs([Process(i, 0, Fraction('0.1'), 0) for i in range(3)], Fraction('0.02'), Fraction('0.004'))
+        self.assertGreater(min(completions(processes).values()), Fraction('0.28'))
+        self.assertEqual(max(completions(processes).values()), Fraction('0.3'))
+
+    def test_cfs_schedule_is_exact_and_scales_with_time(self):
+        # Ints, equal Fractions and tables get the same exact slices, and scaling every time by k
+        # scales the completions by exactly k
+        rng = random.Random(26)
+        for _ in range(TRIALS // 3):
+            workload = random_workload(rng)
+            expected = completions(cfs(processes_of(workload)))
+            self.assertFalse(any(isinstance(time, float) for time in expected.values()))
+            exact = [(pid, Fraction(arrival), Fraction(burst), priority) for pid, arrival, burst, priority in workload]
+            self.assertEqual(completions(cfs(processes_of(exact), Fraction(20), Fraction(4))), expected, workload)
+            self.assertEqual(completions(cfs(ProcessTable.from_processes(processes_of(workload)))), expected)
+            for k in (1000, Fraction(1, 7)):
+                scaled = [(pid, arrival * k, burst * k, priority) for pid, arrival, burst, priority in workload]
+                self.assertEqual(completions(cfs(processes_of(scaled), 20 * k, 4 * k)),
+                                 {pid: time * k for pid, time in expected.items()}, workload)
+
+    def test_aging_preempts_at_the_exact_crossing(self):
+        # The waiting process (priority 5) catches up with the running one (priority 3) at t = 1.5
+        timeline = Timeline()
+        priority_preemptive([Process(1, 0, 10, 3), Process(2, Fraction('0.5'), 2, 5)], timeline,
+                            aging_interval=Fraction('0.5'))
+        self.assertEqual(list(timeline)[0], (0, Fraction('1.5'), 1))
+        self.assertEqual(sum(end - start for start, end, _ in timeline), 12)
+
+    def test_aging_schedule_scales_with_time(self):
+        # Scaling every time (aging_interval included) by k scales the completions by exactly k,
+        # costs the same number of preemptions, and ints behave like the equal Fractions
+        rng = random.Random(25)
+        for _ in range(TRIALS // 3):
+            workload = random_workload(rng)
+            aging_interval = rng.randint(1, 4)
+            for engine in (priority_preemptive, priority_non_preemptive):
+                stats = {}
+                expected = completions(engine(processes_of(workload), stats=stats, aging_interval=aging_interval))
+                exact = [(pid, Fraction(arrival), Fraction(burst), priority) for pid, arrival, burst, priority in workload]
+                self.assertEqual(completions(engine(processes_of(exact), aging_interval=Fraction(aging_interval))),
+                                 expected, workload)
+                for k in (1000, Fraction(1, 7)):
+                    scaled = [(pid, arrival * k, burst * k, priority) for pid, arrival, burst, priority in workload]
+                    scaled_stats = {}
+                    processes = engine(processes_of(scaled), stats=scaled_stats, aging_interval=aging_interval * k)
+                    self.assertEqual(completions(processes), {pid: time * k for pid, time in expected.items()})
+                    self.assertEqual(scaled_stats['preemptions'], stats['preemptions'])
+
+
+class Int64Range(unittest.TestCase):
+
+    def test_times_beyond_int64_stay_lists(self):
+        self.assertTrue(fits_table([Process(1, 2 ** 62, 5, 0)]))
+        self.assertFalse(fits_table([Process(1, 2 ** 63, 5, 0)]))
+        self.assertFalse(fits_table([Process(1, 2 ** 63 - 3, 5, 0)]))  # Completes past int64
+
+    def test_timeline_beyond_int64(self):
+        timeline = Timeline()
+        srtf_preemptive([Process(1, 0, 2, 0), Process(2, 2 ** 63, 2, 0)], timeline)
+        self.assertEqual(list(timeline), [(0, 2, 1), (2 ** 63, 2 ** 63 + 2, 2)])
+
+
+class IoBursts(unittest.TestCase):
+
+    def test_io_returns_reenter_the_ready_queue(self):
+        # P1 computes 2, waits 3 for I/O, computes 1; P2 runs during the I/O and is preempted at 5
+        processes = simulate_bursts([BurstProcess(1, 0, (2, 3, 1), 0), BurstProcess(2, 0, (4,), 1)],
+                                    'priority_preemptive')
+        self.assertEqual(completions(processes), {1: 6, 2: 7})
+        self.assertEqual([process.waiting_time for process in processes], [0, 3])
+
+    # (policy, time_quantum, extra parameters): every policy io_bursts takes, aging included
+    RUNS = [(policy, 3 if policy in ('rr', 'stride', 'lottery') else None, {}) for policy in IO_POLICIES] + \
+           [(policy, None, {'aging_interval': 5}) for policy in ('priority_preemptive', 'priority_non_preemptive')]
+
+    def setUp(self):
+        self.rng = random.Random(8)
+
+    def random_bursts(self):
+        rng = self.rng
+        return [BurstProcess(i, rng.randint(0, 30), [rng.randint(1, 8) for _ in range(2 * rng.randint(0, 3) + 1)],
+                             rng.randrange(4))
+                for i in range(rng.randint(1, 8))]
+
+    def test_single_bursts_match_the_batch_engines(self):
+        for _ in range(TRIALS // 3):
+            workload = random_workload(self.rng)
+            for policy, time_quantum, params in self.RUNS:
+                engine = main.ALGORITHMS[policy][0]
+                batch_params = dict(params, time_quantum=time_quantum) if time_quantum else params
+                expected = completions(engine(processes_of(workload), **batch_params))
+                single = [BurstProcess(i, arrival, (burst,), priority) for i, arrival, burst, priority in workload]
+                processes = simulate_bursts(single, policy, time_quantum, **params)
+                self.assertEqual(completions(processes), expected, (policy, params, workload))
+
+    def test_bursts_respect_their_io(self):
+        for _ in range(TRIALS // 3):
+            for policy, time_quantum, params in self.RUNS:
+                processes = self.random_bursts()
+                stats = {}
+                simulate_bursts(processes, policy, time_quantum, stats, **params)
+                for process in processes:
+                    self.assertGreaterEqual(process.completion_time,
+                                            process.arrival_time + process.burst_time + process.io_time)
+                    self.assertGreaterEqual(process.waiting_time, 0)
+                bursts = sum(len(process.bursts[0::2]) for process in processes)
+                self.assertEqual((stats['bursts'], stats['io_returns']), (bursts, bursts - len(processes)))
+                self.assertEqual(stats['makespan'], max(process.completion_time for process in processes))
+
+    def test_bad_policies_and_parameters_are_rejected(self):
+        bad_runs = [('multicore', None, {}), ('rr', None, {}), ('fcfs', None, {'aging_interval': 5})]
+        for policy, time_quantum, params in bad_runs:
+            with self.assertRaises(ValueError):
+                simulate_bursts([BurstProcess(1, 0, (2, 3, 1), 0)], policy, time_quantum, **params)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+from array import array
+
+from process_table import TYPECODE
+
+GANTT_WIDTH = 120
+
+
+class Timeline:
+    # Run-length execution record: segment k means process pid[k] ran from start[k] to end[k]
+    __slots__ = ('start', 'end', 'pid')
+
+    def __init__(self):
+        self.start = array(TYPECODE)
+        self.end = array(TYPECODE)
+        self.pid = array(TYPECODE)
+
+    def add(self, start, end, pid):
+        if end <= start:
+            return
+        try:
+            if self.pid and self.pid[-1] == pid and self.end[-1] == start:
+                self.end[-1] = end  # Same process keeps running: extend the last segment
+                return
+            self.start.append(start)
+            self.end.append(end)
+            self.pid.append(int(pid))
+        except (TypeError, OverflowError):
+            # Fractional times and values beyond int64 do not fit the columns: keep plain lists from here on
+            self.pid = list(self.pid)
+            self.start = list(self.start)[:len(self.pid)]
+            self.end = list(self.end)[:len(self.pid)]
+            self.add(start, end, pid)
+
+    def extend_from_bytes(self, start, end, pid):
+        # Bulk append of raw int64 columns, e.g. from the NumPy kernel
+        self.start.frombytes(start)
+        self.end.frombytes(end)
+        self.pid.frombytes(pid)
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __iter__(self):
+        return zip(self.start, self.end, self.pid)
+
+
+def render_gantt(timeline, width=GANTT_WIDTH):
+    # O(segments shown): durations are scaled to fit `width` and the chart stops once it is full
+    if not len(timeline):
+        return " |"
+    total_time = timeline.end[-1] - min(0, timeline.start[0])
+    label_width = sum(len(f"|P{timeline.pid[k]}") for k in range(min(len(timeline), width)))
+    scale = min(1.0, max(width - label_width, len(timeline)) / total_time) if total_time > 0 else 1.0
+
+    parts = [" "]
+    length = 1
+    curr_time = min(0, timeline.start[0])
+    for k in range(len(timeline)):
+        start, end, pid = timeline.start[k], timeline.end[k], timeline.pid[k]
+        if start > curr_time:
+            gap = "|" + " " * max(1, round((start - curr_time) * scale))
+            parts.append(gap)
+            length += len(gap)
+        segment = "|" + "-" * max(1, round((end - start) * scale)) + f"P{pid}"
+        if length + len(segment) > width and k > 0:
+            parts.append(f"|... {len(timeline) - k} more segments until t={timeline.end[-1]}")
+            return "".join(parts)
+        parts.append(segment)
+        length += len(segment)
+        curr_time = end
+    parts.append("|")
+    return "".join(parts)